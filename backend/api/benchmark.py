@@ -0,0 +1,255 @@
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from logica.algoritmo.genetico.backtracking import solve_backtracking
+from logica.algoritmo.genetico.evaluacion import evaluate_batch, evaluate_perm
+from logica.libreria.algebra_matrices import producto_punto
+from logica.libreria.binario import desempaquetar, empaquetar
+from logica.objetos.escena import Escena
+from logica.objetos.hexagono import geometria_piso, hexagono
+from logica.objetos.objeto import Objeto
+from logica.objetos.punto import Punto
+from logica.objetos.restricciones import cargar_restricciones
+
+
+def instancia_aleatoria(n: int, semilla: int = 0) -> list[list[int]]:
+    """Matriz simétrica con pesos 0..3 (≈20% de pares prohibidos)."""
+    rng = np.random.default_rng(semilla)
+    W = rng.choice([0, 1, 1, 2, 3], size=(n, n))
+    W = np.triu(W, 1)
+    return (W + W.T).tolist()
+
+
+def instancia_restricciones(k: int):
+    """Primeras k salas de rooms.json con los pesos de restricciones.json."""
+    restricciones = cargar_restricciones("restricciones.json", "rooms.json")
+    rooms = restricciones.nombres[:k]
+    return rooms, restricciones.sub(rooms).lista()
+
+
+def cronometrar(f, repeticiones: int = 1) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        f()
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def bench_evaluacion(n: int = 20):
+    """evaluate_perm (bucle escalar) vs evaluate_batch (fancy indexing)."""
+    A = instancia_aleatoria(n)
+    A_np = np.asarray(A)
+    rng = np.random.default_rng(1)
+
+    print(f"\n--- Evaluación de permutaciones (n={n}) ---")
+    for k in (1_000, 100_000):
+        P = rng.permuted(np.tile(np.arange(n), (k, 1)), axis=1)
+        perms = P.tolist()
+
+        t_escalar = cronometrar(lambda: [evaluate_perm(p, A) for p in perms])
+        t_batch = cronometrar(lambda: evaluate_batch(P, A_np), 5)
+
+        scores, _ = evaluate_batch(P, A_np)
+        assert scores.tolist() == [evaluate_perm(p, A) for p in perms]
+        print(f"{k:>7} perms: escalar {t_escalar*1e3:8.2f} ms | "
+              f"batch {t_batch*1e3:7.2f} ms | x{t_escalar / t_batch:5.1f}")
+
+
+def bench_backtracking(k: int = 10):
+    """
+    Nodos por segundo: engine recursivo vs iterativo (sin cota). El recursivo
+    con verbose=True (a /dev/null) reproduce el print por nodo original.
+    """
+    rooms, A = instancia_restricciones(k)
+
+    print(f"\n--- Backtracking, throughput de nodos ({k} salas) ---")
+    resultados = {}
+    for engine, verbose in (("recursivo", True), ("recursivo", False), ("iterativo", False)):
+        with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+            inicio = time.perf_counter()
+            perm, score, stats = solve_backtracking(rooms, A, engine=engine, verbose=verbose)
+            t = time.perf_counter() - inicio
+        resultados[engine] = (perm, score)
+        etiqueta = engine + (" +print" if verbose else "")
+        print(f"{etiqueta:>16}: {stats.nodes_expanded} nodos en {t:6.2f} s "
+              f"({stats.nodes_expanded / t:,.0f} nodos/s) | score {score}")
+    assert resultados["recursivo"] == resultados["iterativo"]
+
+
+def bench_simetria(k: int = 10):
+    """Hojas y nodos con y sin ruptura de simetría por reflexión."""
+    rooms, A = instancia_restricciones(k)
+
+    print(f"\n--- Simetría por reflexión ({k} salas) ---")
+    for bound in (False, True):
+        _, score, base = solve_backtracking(rooms, A, bound=bound)
+        perm, score_sim, sim = solve_backtracking(rooms, A, bound=bound, simetria=True)
+        assert score == score_sim and evaluate_perm(perm, A) == score
+        print(f"bound={bound!s:5}: hojas {base.leaves_feasible:>7} -> {sim.leaves_feasible:>7} | "
+              f"nodos {base.nodes_expanded:>7} -> {sim.nodes_expanded:>7} | score {score}")
+
+
+def bench_transformar(repeticiones: int = 36):
+    """
+    'repeticiones' rotaciones de 5° en z y una lectura: producto_punto por
+    vértice en cada rotación (camino original) vs Objeto, que compone las
+    matrices y materializa con un solo V @ Mᵀ al leer.
+    """
+    rng = np.random.default_rng(2)
+    theta = np.radians(5)
+    M = [[np.cos(theta), -np.sin(theta), 0], [np.sin(theta), np.cos(theta), 0], [0, 0, 1]]
+
+    print(f"\n--- Transformaciones de Objeto ({repeticiones} rotaciones) ---")
+    for n in (12, 1_000, 10_000):
+        V = rng.normal(size=(n, 3))
+        o = Objeto().set_coordenadas(V)
+
+        def lista():
+            anidada = V[:, :, None].tolist()
+            for _ in range(repeticiones):
+                anidada = [producto_punto(M, v) for v in anidada]
+            return anidada
+
+        t_lista = cronometrar(lista)
+        def objeto():
+            for _ in range(repeticiones):
+                o.rotar_z(5)
+            return o.coordenadas
+
+        t_numpy = cronometrar(objeto)
+        assert np.allclose(np.asarray(lista())[:, :, 0], o.set_coordenadas(V).rotar_z(5 * repeticiones).coordenadas)
+        print(f"{n:>7} vértices: producto_punto {t_lista*1e3:9.2f} ms | "
+              f"objeto {t_numpy*1e3:7.2f} ms | x{t_lista / t_numpy:6.1f}")
+
+
+def bench_escena(lado: int = 100):
+    """Rotar lado² hexágonos: Objeto por Objeto vs una Escena en bloque."""
+    objetos = [hexagono((i, j, 1.0), 1.0) for i in range(lado) for j in range(lado)]
+    escena = Escena(objetos)
+
+    print(f"\n--- Escena ({len(objetos)} hexágonos) ---")
+    t_objetos = cronometrar(lambda: [o.rotar_z(5).coordenadas for o in objetos])
+    t_escena = cronometrar(lambda: escena.rotar_z(5), 10)
+    t_centro = cronometrar(lambda: escena.rotar_z(5, np.arange(0, len(objetos), 2), "centro"), 10)
+    print(f"por objeto {t_objetos*1e3:8.2f} ms | escena {t_escena*1e3:6.2f} ms | "
+          f"mitad, pivote centro {t_centro*1e3:6.2f} ms")
+
+
+class PuntoDict:
+    """Punto original (con __dict__), solo para comparar."""
+
+    def __init__(self, m) -> None:
+        self.x = m[0][0]
+        self.y = m[1][0]
+        self.z = m[2][0]
+
+
+def bench_punto(n: int = 1_000_000):
+    """
+    Memoria y tiempo para construir n puntos (con tracemalloc activo). Los
+    casos desde 'tuplas' reutilizan floats ya creados; desde_array y el
+    arreglo parten de coords, así que incluyen los floats nuevos.
+    """
+    coords = np.random.default_rng(3).normal(size=(n, 3))
+    tuplas = coords.tolist()
+
+    casos = {
+        "Punto original (nested)": lambda: [PuntoDict([[x], [y], [z]]) for x, y, z in tuplas],
+        "Punto slots (nested)": lambda: [Punto([[x], [y], [z]]) for x, y, z in tuplas],
+        "Punto.desde_tupla": lambda: [Punto.desde_tupla(t) for t in tuplas],
+        "Punto.desde_array": lambda: Punto.desde_array(coords),
+        "arreglo (n, 3)": lambda: coords.copy(),
+    }
+
+    print(f"\n--- Punto ({n:,} puntos) ---")
+    for nombre, construir in casos.items():
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        puntos = construir()
+        t = time.perf_counter() - inicio
+        memoria, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del puntos
+        print(f"{nombre:>24}: {memoria / n:6.1f} B/punto | {memoria / 2**20:7.1f} MiB | {t*1e3:7.1f} ms")
+
+
+def bench_mallas():
+    """
+    Construir un Objeto de n vértices: append + reescaneo de límites por
+    vértice (comportamiento original, solo hasta 10k), add_vertice (O(1)
+    amortizado) y add_vertices con el arreglo completo.
+    """
+    rng = np.random.default_rng(4)
+
+    def original(puntos):
+        vertices = []
+        for p in puntos:
+            vertices.append(p)
+            xs = [v.x for v in vertices]
+            ys = [v.y for v in vertices]
+            zs = [v.z for v in vertices]
+            dims = (max(xs) - min(xs), max(ys) - min(ys), max(zs) - min(zs))
+        return dims
+
+    def uno_a_uno(puntos):
+        o = Objeto()
+        for p in puntos:
+            o.add_vertice(p)
+        return o.largo, o.ancho, o.alto
+
+    print("\n--- Construcción de mallas ---")
+    for n in (10_000, 100_000, 1_000_000):
+        V = rng.normal(size=(n, 3))
+        puntos = Punto.desde_array(V) if n <= 100_000 else None
+        esperado = tuple(np.ptp(V, axis=0).tolist())
+
+        columnas = []
+        if n <= 10_000:
+            columnas.append(f"original {cronometrar(lambda: original(puntos)):8.3f} s")
+        if puntos is not None:
+            assert np.allclose(uno_a_uno(puntos), esperado)
+            columnas.append(f"add_vertice {cronometrar(lambda: uno_a_uno(puntos)):7.3f} s")
+        o = Objeto()
+        t_bloque = cronometrar(lambda: o.set_coordenadas(np.empty((0, 3))).add_vertices(V).largo)
+        assert np.isclose(o.largo, esperado[0])
+        columnas.append(f"add_vertices {t_bloque*1e3:7.2f} ms")
+        print(f"{n:>9} vértices: " + " | ".join(columnas))
+
+
+def bench_transporte():
+    """Hexágonos de un piso de k anillos: JSON de listas vs formato binario."""
+    print("\n--- Transporte de geometría (hexágonos del piso) ---")
+    for anillos in (1, 10, 50):
+        _, H = geometria_piso(1.0, 0.25, anillos)
+        t_json = cronometrar(lambda: json.dumps(H.tolist(), separators=(",", ":")).encode(), 3)
+        t_bin = cronometrar(lambda: empaquetar(H), 3)
+        n_json = len(json.dumps(H.tolist(), separators=(",", ":")).encode())
+        datos = empaquetar(H)
+        vertices, indices = desempaquetar(datos)
+        assert np.allclose(vertices[indices], H, atol=1e-5)
+        print(f"{len(H):>6} celdas: JSON {n_json/1024:9.1f} KiB {t_json*1e3:8.2f} ms | "
+              f"binario {len(datos)/1024:8.1f} KiB {t_bin*1e3:7.2f} ms | "
+              f"x{n_json/len(datos):5.1f} bytes, x{t_json/t_bin:5.1f} cpu")
+
+
+BENCHMARKS = {
+    "evaluacion": bench_evaluacion,
+    "backtracking": bench_backtracking,
+    "simetria": bench_simetria,
+    "transformar": bench_transformar,
+    "escena": bench_escena,
+    "punto": bench_punto,
+    "mallas": bench_mallas,
+    "transporte": bench_transporte,
+}
+
+if __name__ == "__main__":
+    # python benchmark.py [nombre ...]  (sin argumentos corre todos)
+    nombres = sys.argv[1:] or list(BENCHMARKS)
+    for nombre in nombres:
+        BENCHMARKS[nombre]()
@@ -2,58 +2,43 @@ import json
 
 # Usa tus funciones
 from logica.algoritmo.genetico.backtracking import solve_backtracking
-from logica.objetos.nodo import Nodo, matriz_adyacencia
+from logica.objetos.nodo import Nodo
 
 if __name__ == "__main__":
     with open("restricciones.json", "r", encoding="utf-8") as f:
         data = json.load(f)
     floor = 1
 
-    rooms = []
+    # Nombre de sala -> Nodo (una sola instancia por sala, sin búsquedas lineales)
+    nodos: dict[str, Nodo] = {}
+
+    def nodo_de(nombre: str) -> Nodo:
+        if nombre not in nodos:
+            nodos[nombre] = Nodo(nombre)
+        return nodos[nombre]
 
     zero_pairs_all = data["zero_pairs"]
 
     for a, b in zero_pairs_all:
-        n1 = next((n for n in rooms if n == a), None)
-        if not n1:
-            n1 = Nodo(a)
-            rooms.append(n1)
-
-        n2 = next((n for n in rooms if n == b), None)
-        if not n2:
-            n2 = Nodo(b)
-            rooms.append(n2)
-
-        n1.add_restriccion(n2)
+        nodo_de(a).add_restriccion(nodo_de(b))
 
     prefs_all = data["preferences"]
 
     for pref in prefs_all:
         a, b = pref["pair"]
+        nodo_de(a).add_preferencia(nodo_de(b))
 
-        n1 = next((n for n in rooms if n == a), None)
-        if not n1:
-            n1 = Nodo(a)
-            rooms.append(n1)
-
-        n2 = next((n for n in rooms if n == b), None)
-        if not n2:
-            n2 = Nodo(b)
-            rooms.append(n2)
-
-        n1.add_preferencia(n2)
+    rooms = list(nodos.values())
 
     for nodo in rooms:
         print(f"\nNodo: {nodo}")
         print(f"Restriccion: {nodo.restriccion}")
         print(f"Preferencia: {nodo.preferencia}\n")
 
-    # # 3) Filtra restricciones/preferencias para que solo consideren estas 6 rooms
-    # zero_pairs = filtrar_zero_pairs(zero_pairs_all, rooms)
-    # prefs = filtrar_prefs(prefs_all, rooms)
-
-    # # 4) Construye la matriz de adyacencia (por defecto, donde no hay preferencia explícita = 1)
-    # A, idx = matriz_adyacencia(rooms, zero_pairs, prefs, default_weight=1)
+    # # 3-4) Matriz de adyacencia (cacheada) restringida a estas rooms
+    # restricciones = cargar_restricciones("restricciones.json", "rooms.json")
+    # rooms = [r.id for r in rooms]
+    # A = restricciones.sub(rooms).lista()
 
     # # 5) Ejecuta el backtracking con "Mantención" fija en el slot 0 solo planta baja
     # if floor == 0:
@@ -75,6 +60,7 @@ if __name__ == "__main__":
     # print("Hijos lógicos generados:", stats.children_generated)
     # print("Hijos válidos (explorados):", stats.children_valid)
     # print("Hijos podados por A=0:", stats.children_pruned_zero)
+    # print("Hijos podados por cota:", stats.children_pruned_bound)
     # print("Layouts completos válidos:", stats.leaves_feasible)
     # print("Layouts completos inválidos (cierre anillo):", stats.leaves_infeasible)
     # print("Expansiones por profundidad (slot):", dict(
@@ -1,7 +1,7 @@
 # ----------------------------
 # Instrumentación de búsqueda
 # ----------------------------
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Dict
 
 
@@ -11,6 +11,28 @@ class Stats:
     children_generated: int = 0        # hijos "lógicos" (antes de podar por A=0)
     children_valid: int = 0            # hijos que pasan filtros y se exploran
     children_pruned_zero: int = 0      # hijos descartados por A=0 (prohibidos)
+    children_pruned_bound: int = 0     # hijos descartados por cota superior (branch-and-bound)
+    children_pruned_symmetry: int = 0  # hijos descartados por ser el reflejo de otro anillo
     leaves_feasible: int = 0           # layouts completos válidos
     leaves_infeasible: int = 0         # layouts completos inválidos (cierre anillo)
     depth_expansions: Dict[int, int] = field(default_factory=dict)  # expansiones por profundidad
+    timed_out: bool = False            # cortada por deadline, presupuesto de nodos o cancelación
+    generations: int = 0               # generaciones completadas (algoritmo genético)
+    moves_evaluated: int = 0           # movimientos 2-opt / Or-opt evaluados (búsqueda local)
+    moves_applied: int = 0             # movimientos que mejoraron y se aplicaron
+    restarts: int = 0                  # reinicios aleatorios (búsqueda local)
+    dp_table_size: int = 0             # celdas de la tabla DP (Held–Karp)
+    dp_peak_bytes: int = 0             # memoria pico estimada de la DP (tabla + temporales)
+
+    def merge(self, other: "Stats") -> "Stats":
+        """Suma los contadores de 'other' (p. ej. de otro worker) en self."""
+        for f in fields(self):
+            mio, suyo = getattr(self, f.name), getattr(other, f.name)
+            if isinstance(mio, dict):
+                for k, v in suyo.items():
+                    mio[k] = mio.get(k, 0) + v
+            elif isinstance(mio, bool):
+                setattr(self, f.name, mio or suyo)
+            else:
+                setattr(self, f.name, mio + suyo)
+        return self
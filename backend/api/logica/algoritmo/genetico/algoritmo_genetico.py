@@ -0,0 +1,211 @@
+# ----------------------------
+# Algoritmo genético sobre anillos
+# ----------------------------
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from logica.algoritmo.genetico import Stats
+from logica.algoritmo.genetico.control import Cancelacion, Control
+from logica.algoritmo.genetico.evaluacion import evaluate_population
+
+
+def _torneo(rng: np.random.Generator, fitness: np.ndarray, k: int, cantidad: int) -> np.ndarray:
+    """Índices ganadores de 'cantidad' torneos de tamaño k."""
+    competidores = rng.integers(0, len(fitness), size=(cantidad, k))
+    ganador = np.argmax(fitness[competidores], axis=1)
+    return competidores[np.arange(cantidad), ganador]
+
+
+def _cortes(rng: np.random.Generator, filas: int, m: int):
+    a = rng.integers(0, m, size=filas)
+    b = rng.integers(0, m, size=filas)
+    return np.minimum(a, b), np.maximum(a, b) + 1
+
+
+def cruce_ox(rng: np.random.Generator, P1: np.ndarray, P2: np.ndarray) -> np.ndarray:
+    """
+    Order crossover (OX) vectorizado para todas las parejas a la vez.
+    El hijo copia P1[a:b] y completa las posiciones libres (desde b, circular)
+    con los genes de P2 en su orden, saltando los ya copiados.
+    """
+    filas, m = P1.shape
+    a, b = _cortes(rng, filas, m)
+    col = np.arange(m)
+    filas_idx = np.arange(filas)[:, None]
+
+    en_segmento = (col >= a[:, None]) & (col < b[:, None])
+    # copiado[i, g] = el gen g quedó dentro del segmento de P1
+    copiado = np.zeros((filas, m), dtype=bool)
+    copiado[filas_idx, P1] = en_segmento
+
+    rot = (col + b[:, None]) % m
+    P2_rot = np.take_along_axis(P2, rot, axis=1)
+    libres = ~np.take_along_axis(en_segmento, rot, axis=1)
+
+    hijos = np.where(en_segmento, P1, -1)
+    filas_libres = np.broadcast_to(filas_idx, (filas, m))[libres]
+    hijos[filas_libres, rot[libres]] = P2_rot[~copiado[filas_idx, P2_rot]]
+    return hijos
+
+
+def cruce_pmx(rng: np.random.Generator, P1: np.ndarray, P2: np.ndarray) -> np.ndarray:
+    """Partially mapped crossover (PMX), fila por fila."""
+    filas, m = P1.shape
+    a, b = _cortes(rng, filas, m)
+    hijos = P2.copy()
+    pos_en_p2 = np.argsort(P2, axis=1)
+    for f in range(filas):
+        p1, p2, ia, ib = P1[f], P2[f], a[f], b[f]
+        hijo = hijos[f]
+        hijo[ia:ib] = p1[ia:ib]
+        segmento = set(p1[ia:ib].tolist())
+        for i in range(ia, ib):
+            v = p2[i]
+            if v in segmento:
+                continue
+            pos = i
+            while ia <= pos < ib:
+                pos = pos_en_p2[f, p1[pos]]
+            hijo[pos] = v
+    return hijos
+
+
+def mutar_swap(rng: np.random.Generator, P: np.ndarray, prob: float) -> None:
+    """Intercambia dos genes en las filas sorteadas (in place)."""
+    filas = np.flatnonzero(rng.random(len(P)) < prob)
+    if len(filas) == 0:
+        return
+    m = P.shape[1]
+    i = rng.integers(0, m, size=len(filas))
+    j = rng.integers(0, m, size=len(filas))
+    P[filas, i], P[filas, j] = P[filas, j], P[filas, i]
+
+
+def mutar_inversion(rng: np.random.Generator, P: np.ndarray, prob: float) -> None:
+    """Invierte un segmento [a, b) en las filas sorteadas (in place)."""
+    filas = np.flatnonzero(rng.random(len(P)) < prob)
+    if len(filas) == 0:
+        return
+    m = P.shape[1]
+    a, b = _cortes(rng, len(filas), m)
+    col = np.arange(m)
+    dentro = (col >= a[:, None]) & (col < b[:, None])
+    origen = np.where(dentro, a[:, None] + b[:, None] - 1 - col, col)
+    P[filas] = np.take_along_axis(P[filas], origen, axis=1)
+
+
+def solve_genetico(rooms: List[str],
+                   A: List[List[int]],
+                   anchor_room: Optional[str] = None,
+                   poblacion: int = 200,
+                   generaciones: Optional[int] = 500,
+                   tiempo_limite: Optional[float] = None,
+                   elite: int = 4,
+                   torneo: int = 3,
+                   cruce: str = "ox",
+                   prob_swap: float = 0.2,
+                   prob_inversion: float = 0.2,
+                   semilla: Optional[int] = None,
+                   cancelacion: Optional[Cancelacion] = None,
+                   progreso: Optional[Callable[[dict], None]] = None,
+                   intervalo_progreso: int = 10_000):
+    """
+    Algoritmo genético sobre permutaciones del anillo.
+    - Fija anchor_room en slot 0; cada individuo es una fila (N-1) con el resto.
+    - Toda la población se evalúa de una vez con evaluate_population sobre un
+      arreglo (pop, N); cada arista A=0 penaliza más que cualquier puntaje posible,
+      así un layout factible siempre gana a uno infactible.
+    - Selección por torneo, cruce OX (vectorizado) o PMX, mutación swap e
+      inversión, y elitismo de los 'elite' mejores.
+    - Se detiene al cumplir 'generaciones' o 'tiempo_limite' (segundos), lo
+      primero que ocurra (None = sin ese límite).
+    - cancelacion corta entre generaciones (stats.timed_out = True); progreso(dict)
+      se llama cada 'intervalo_progreso' individuos evaluados y al terminar.
+    - Stats: nodes_expanded = individuos evaluados, children_generated = hijos,
+      children_valid / children_pruned_zero = hijos factibles / con A=0.
+    Devuelve (perm, score, stats) como solve_backtracking.
+    """
+    if generaciones is None and tiempo_limite is None:
+        raise ValueError("Se necesita 'generaciones' o 'tiempo_limite'")
+
+    n = len(rooms)
+    idx = {r: i for i, r in enumerate(rooms)}
+    if anchor_room is None:
+        anchor_room = rooms[0]
+    anchor = idx[anchor_room]
+
+    stats = Stats()
+    W = np.asarray(A, dtype=np.int64)
+    otros = np.array([i for i in range(n) if i != anchor], dtype=np.intp)
+    m = len(otros)
+    if m == 0:
+        return None, -10**9, stats
+
+    rng = np.random.default_rng(semilla)
+    operador = {"ox": cruce_ox, "pmx": cruce_pmx}[cruce]
+    elite = min(elite, poblacion)
+    penalizacion = n * int(np.abs(W).max(initial=0)) + 1
+    columna_anchor = np.full((poblacion, 1), anchor, dtype=np.intp)
+
+    def evaluar(G: np.ndarray):
+        # G guarda posiciones dentro de 'otros'; se arma el anillo completo
+        scores, ceros = evaluate_population(np.hstack([columna_anchor[:len(G)], otros[G]]), W)
+        stats.nodes_expanded += len(G)
+        return scores, ceros, scores - penalizacion * ceros
+
+    G = rng.permuted(np.tile(np.arange(m), (poblacion, 1)), axis=1)
+    scores, ceros, fitness = evaluar(G)
+
+    best = {"score": -10**9, "perm": None}
+
+    def registrar(G, scores, ceros):
+        factibles = np.flatnonzero(ceros == 0)
+        if len(factibles) == 0:
+            return
+        i = factibles[np.argmax(scores[factibles])]
+        if scores[i] > best["score"]:
+            best["score"] = int(scores[i])
+            best["perm"] = [anchor] + otros[G[i]].tolist()
+
+    registrar(G, scores, ceros)
+    inicio = time.perf_counter()
+    control = None
+    if cancelacion is not None or progreso is not None:
+        control = Control(cancelacion=cancelacion, progreso=progreso,
+                          intervalo_progreso=intervalo_progreso)
+    hijos_por_gen = poblacion - elite
+
+    while True:
+        if generaciones is not None and stats.generations >= generaciones:
+            break
+        if tiempo_limite is not None and time.perf_counter() - inicio >= tiempo_limite:
+            break
+        if (control is not None and stats.nodes_expanded >= control.proximo
+                and control.chequear(stats, best, stats.nodes_expanded)):
+            break
+
+        padres1 = G[_torneo(rng, fitness, torneo, hijos_por_gen)]
+        padres2 = G[_torneo(rng, fitness, torneo, hijos_por_gen)]
+        hijos = operador(rng, padres1, padres2)
+        mutar_swap(rng, hijos, prob_swap)
+        mutar_inversion(rng, hijos, prob_inversion)
+
+        elites = G[np.argsort(-fitness, kind="stable")[:elite]]
+        G = np.vstack([elites, hijos])
+        scores, ceros, fitness = evaluar(G)
+
+        stats.children_generated += hijos_por_gen
+        infactibles = int(np.count_nonzero(ceros[elite:]))
+        stats.children_pruned_zero += infactibles
+        stats.children_valid += hijos_por_gen - infactibles
+        stats.generations += 1
+        registrar(G, scores, ceros)
+
+    factibles = int(np.count_nonzero(ceros == 0))
+    stats.leaves_feasible = factibles
+    stats.leaves_infeasible = len(G) - factibles
+    if control is not None:
+        control.reportar(stats, best)
+    return best["perm"], best["score"], stats
@@ -1,8 +1,12 @@
 # ----------------------------
 # Backtracking con poda (DFS)
 # ----------------------------
-from typing import List, Optional
+from typing import Callable, List, Optional
 from logica.algoritmo.genetico import Stats
+from logica.algoritmo.genetico.control import Cancelacion, Control
+
+# Cada cuántos nodos se relee el mejor puntaje compartido entre procesos
+REFRESCO = 1024
 
 
 def backtrack(stats: Stats,
@@ -13,11 +17,22 @@ def backtrack(stats: Stats,
               A: list[list[int]],
               n: int,
               zeros_count: list[int],
-              best: dict):
+              best: dict,
+              cota: Optional[dict] = None,
+              verbose: bool = False,
+              simetria: bool = False,
+              control: Optional[Control] = None):
     # pos = índice de slot a llenar (1..N-1). Slot 0 ya está fijo (anchor).
+    # cota = None ⇒ solo poda por A=0; si no, branch-and-bound (ver cotas_iniciales)
+    # simetria ⇒ solo anillos con slots[1] < slots[n-1] (descarta el reflejo)
+    # control ⇒ deadline / presupuesto / cancelación (corta con stats.timed_out)
     stats.nodes_expanded += 1
-    print("ejecutando back")
+    if verbose:
+        print("ejecutando back", pos)
     stats.depth_expansions[pos] = stats.depth_expansions.get(pos, 0) + 1
+    if (control is not None and stats.nodes_expanded >= control.proximo
+            and control.chequear(stats, best, stats.nodes_expanded)):
+        return
 
     # ¿completamos todos los slots?
     if pos == n:
@@ -51,29 +66,246 @@ def backtrack(stats: Stats,
         # Poda de cierre: si es el último slot, checa también con el anchor (slot 0)
         if pos == n-1 and A[r][slots[0]] == 0:
             continue
+        if simetria and pos == n-1 and n > 2 and r < slots[1]:
+            stats.children_pruned_symmetry += 1
+            continue
+
+        new_score = current_score + A[prev][r]
+        if cota is not None:
+            # Cota optimista (x2 para trabajar en enteros): cada arista que falta
+            # se reparte entre sus dos extremos; r y el anchor aportan su mejor
+            # arista, cada sala restante sus dos mejores.
+            resto = cota["top2_restantes"] - cota["top2"][r]
+            optimista = 2*new_score + cota["top1"][r] + cota["top1"][slots[0]] + resto
+            if optimista <= 2*best["score"]:
+                stats.children_pruned_bound += 1
+                continue
 
         stats.children_valid += 1
         # Colocar r y continuar
         slots[pos] = r
         # sin mutar la lista original
         new_remaining = [x for x in remaining if x != r]
+        if cota is not None:
+            cota["top2_restantes"] -= cota["top2"][r]
         backtrack(stats, slots, pos+1, new_remaining,
-                  current_score + A[prev][r],
-                  A, n, zeros_count, best)
+                  new_score,
+                  A, n, zeros_count, best, cota, verbose, simetria, control)
+        if cota is not None:
+            cota["top2_restantes"] += cota["top2"][r]
         slots[pos] = -1
+        if stats.timed_out:
+            return
+
+
+def backtrack_iterativo(stats: Stats,
+                        slots: list[int],
+                        pos: int,
+                        mask: int,
+                        current_score: int,
+                        A: list[list[int]],
+                        n: int,
+                        orden: list[list[int]],
+                        vecinos: list[int],
+                        best: dict,
+                        cota: Optional[dict] = None,
+                        verbose: bool = False,
+                        compartido=None,
+                        simetria: bool = False,
+                        control: Optional[Control] = None):
+    """
+    Mismo DFS que backtrack (mismo orden, mismas podas, mismos Stats) sin
+    recursión ni listas nuevas por nodo:
+      - mask: bitmask de salas restantes (bit r = sala r sin colocar)
+      - orden[prev]: candidatos factibles de prev, ya ordenados por la heurística
+      - vecinos[prev]: bitmask de salas con A[prev][r] != 0
+      - pila explícita: cursor[pos] = próximo candidato a probar en el slot pos,
+        quedan[pos] = candidatos aún sin colocar que faltan por recorrer (corta
+        el recorrido de orden[prev] apenas se agotan)
+    compartido: multiprocessing.Value con el mejor puntaje global (modo paralelo).
+    Se lee cada REFRESCO nodos y se publica al mejorar; solo poda hijos que no
+    pueden alcanzarlo (estricto), así los empates se resuelven igual que en serie.
+    control: si se cumple un presupuesto o se cancela, sale dejando en 'best' el
+    mejor incumbente y stats.timed_out = True.
+    """
+    anchor = slots[0]
+    inicio = pos
+    scores = [0]*(n+1)
+    cursor = [0]*(n+1)
+    quedan = [0]*(n+1)
+    scores[pos] = current_score
+    if cota is not None:
+        top1, top2 = cota["top1"], cota["top2"]
+        restantes = cota["top2_restantes"]
+    global_best = compartido.value if compartido is not None else -10**9
+
+    expandir = True
+    while True:
+        if expandir:
+            expandir = False
+            stats.nodes_expanded += 1
+            if verbose:
+                print("ejecutando back", pos)
+            stats.depth_expansions[pos] = stats.depth_expansions.get(pos, 0) + 1
+            if compartido is not None and stats.nodes_expanded % REFRESCO == 0:
+                global_best = compartido.value
+            if (control is not None and stats.nodes_expanded >= control.proximo
+                    and control.chequear(stats, best, stats.nodes_expanded)):
+                break
+
+            if pos == n:
+                last = slots[n-1]
+                if A[last][anchor] == 0:
+                    stats.leaves_infeasible += 1
+                else:
+                    total = scores[pos] + A[last][anchor]
+                    stats.leaves_feasible += 1
+                    if total > best["score"]:
+                        best["score"] = total
+                        best["perm"] = slots.copy()
+                        if compartido is not None and total > global_best:
+                            with compartido.get_lock():
+                                if total > compartido.value:
+                                    compartido.value = total
+                                global_best = compartido.value
+            else:
+                libres = n - pos
+                factibles = (mask & vecinos[slots[pos-1]]).bit_count()
+                stats.children_generated += libres
+                stats.children_pruned_zero += libres - factibles
+                cursor[pos] = 0
+                quedan[pos] = factibles
+
+        if pos < n:
+            prev = slots[pos-1]
+            candidatos = orden[prev]
+            k = cursor[pos]
+            q = quedan[pos]
+            while q:
+                r = candidatos[k]
+                k += 1
+                if not (mask >> r) & 1:
+                    continue
+                q -= 1
+                if pos == n-1 and A[r][anchor] == 0:
+                    continue
+                if simetria and pos == n-1 and n > 2 and r < slots[1]:
+                    stats.children_pruned_symmetry += 1
+                    continue
+
+                new_score = scores[pos] + A[prev][r]
+                if cota is not None:
+                    optimista = 2*new_score + top1[r] + top1[anchor] + restantes - top2[r]
+                    if optimista <= 2*best["score"] or optimista < 2*global_best:
+                        stats.children_pruned_bound += 1
+                        continue
+
+                stats.children_valid += 1
+                cursor[pos] = k
+                quedan[pos] = q
+                slots[pos] = r
+                mask ^= 1 << r
+                if cota is not None:
+                    restantes -= top2[r]
+                pos += 1
+                scores[pos] = new_score
+                expandir = True
+                break
+            if expandir:
+                continue
+
+        # sin más hijos: volver al padre y deshacer su elección
+        pos -= 1
+        if pos < inicio:
+            break
+        r = slots[pos]
+        mask |= 1 << r
+        if cota is not None:
+            restantes += top2[r]
+        slots[pos] = -1
+
+
+def ordenar_candidatos(A: list[list[int]], n: int, zeros_count: list[int]):
+    """
+    Precalcula una vez, para cada prev, los candidatos con A[prev][r] != 0 en el
+    orden de expansión de backtrack, y su bitmask.
+    """
+    orden = []
+    vecinos = []
+    for prev in range(n):
+        cand = [r for r in range(n) if r != prev and A[prev][r] != 0]
+        cand.sort(key=lambda r: (-A[prev][r], -zeros_count[r]))
+        orden.append(cand)
+        vecinos.append(sum(1 << r for r in cand))
+    return orden, vecinos
+
+
+def cotas_iniciales(A: list[list[int]], n: int, remaining: list[int]) -> dict:
+    """
+    Precalcula por sala su mejor arista factible (top1) y la suma de sus dos
+    mejores (top2). En un anillo cada sala toca exactamente dos aristas, así que
+    (suma de extremos)/2 es una cota superior admisible del puntaje que falta.
+    'top2_restantes' se mantiene incrementalmente durante el DFS.
+    """
+    top1 = [0]*n
+    top2 = [0]*n
+    for i in range(n):
+        pesos = sorted((A[i][j] for j in range(n) if j != i and A[i][j] != 0),
+                       reverse=True)
+        top1[i] = pesos[0] if pesos else 0
+        top2[i] = sum(pesos[:2])
+    return {"top1": top1, "top2": top2,
+            "top2_restantes": sum(top2[r] for r in remaining)}
+
+
+def exigir_simetrica(A: List[List[int]], n: int) -> None:
+    """simetria=True solo es correcta si A[i][j] == A[j][i]: si no, ValueError."""
+    for i in range(n):
+        for j in range(i + 1, n):
+            if A[i][j] != A[j][i]:
+                raise ValueError("simetria=True requiere A simétrica: "
+                                 f"A[{i}][{j}]={A[i][j]} != A[{j}][{i}]={A[j][i]}")
 
 
 def solve_backtracking(rooms: List[str],
                        A: List[List[int]],
-                       anchor_room: Optional[str] = None):
+                       anchor_room: Optional[str] = None,
+                       bound: bool = False,
+                       engine: str = "iterativo",
+                       verbose: bool = False,
+                       simetria: bool = False,
+                       tiempo_limite: Optional[float] = None,
+                       max_nodos: Optional[int] = None,
+                       cancelacion: Optional[Cancelacion] = None,
+                       progreso: Optional[Callable[[dict], None]] = None,
+                       intervalo_progreso: int = 10_000):
     """
     - Fija anchor_room en slot 0 para romper simetría.
     - Coloca el resto sala a sala (slots 1..N-1), podando si A=0 con el vecino ya colocado.
     - Heurística:
         * Ordena candidatos por A[prev][r] (ganancia inmediata) y, de tie-breaker,
           por cuántos 'ceros' tiene r (más restrictiva primero).
+    - bound=True: branch-and-bound, descarta hijos cuya cota optimista no supera
+      el mejor puntaje conocido (Stats.children_pruned_bound).
+    - engine: "iterativo" (bitmask + pila explícita, sin asignaciones por nodo)
+      o "recursivo" (implementación original). Mismo resultado y mismos Stats.
+    - verbose=True imprime cada nodo expandido.
+    - simetria=True: con A simétrica cada anillo aparece dos veces (horario y
+      antihorario); al elegir el último slot se exige slots[1] < slots[n-1] y
+      se explora solo uno. Mismo puntaje óptimo, la mitad de hojas sin bound.
+      Con bound=True no conviene: la cota ya descarta casi todos los reflejos
+      y el corte puede tirar el primer óptimo encontrado y demorar el
+      incumbente (en instancias chicas llega a expandir varias veces más
+      nodos). Con A no simétrica el corte pierde anillos: ValueError.
+    - tiempo_limite (s), max_nodos y cancelacion cortan la búsqueda: se devuelve
+      el mejor incumbente con stats.timed_out = True (se puede pulir con
+      solve_local_search(perm_inicial=perm)).
+    - progreso(dict) se llama cada 'intervalo_progreso' nodos y al terminar con
+      nodes_expanded, best_score, best_perm, depth_expansions y elapsed.
     """
     n = len(rooms)
+    if simetria:
+        exigir_simetrica(A, n)
     idx = {r: i for i, r in enumerate(rooms)}
     if anchor_room is None:
         anchor_room = rooms[0]
@@ -88,6 +320,24 @@ def solve_backtracking(rooms: List[str],
     # MRV-ish: cuántos vecinos prohibidos tiene cada sala
     zeros_count = [sum(1 for j in range(n) if A[i][j] == 0) for i in range(n)]
 
+    cota = cotas_iniciales(A, n, remaining) if bound else None
+
+    control = None
+    if any(x is not None for x in (tiempo_limite, max_nodos, cancelacion, progreso)):
+        control = Control(tiempo_limite, max_nodos, cancelacion, progreso, intervalo_progreso)
+
     best = {"score": -10**9, "perm": None}
-    backtrack(stats, slots, 1, remaining, 0, A, n, zeros_count, best)
+    if engine == "iterativo":
+        orden, vecinos = ordenar_candidatos(A, n, zeros_count)
+        mask = sum(1 << r for r in remaining)
+        backtrack_iterativo(stats, slots, 1, mask, 0, A, n, orden, vecinos,
+                            best, cota, verbose, simetria=simetria, control=control)
+    elif engine == "recursivo":
+        backtrack(stats, slots, 1, remaining, 0, A, n, zeros_count, best, cota, verbose,
+                  simetria, control)
+    else:
+        raise ValueError(f"engine desconocido: {engine}")
+
+    if control is not None:
+        control.reportar(stats, best)
     return best["perm"], best["score"], stats
@@ -0,0 +1,172 @@
+# ----------------------------
+# Búsqueda local anytime (2-opt / Or-opt)
+# ----------------------------
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from logica.algoritmo.genetico import Stats
+from logica.algoritmo.genetico.control import Cancelacion, Control
+from logica.algoritmo.genetico.evaluacion import evaluate_batch, evaluate_perm
+
+# Cada cuántas evaluaciones se mira el reloj
+CHEQUEO_RELOJ = 512
+
+
+def _descenso(p: list[int], Wp: list[list[int]], n: int, or_max: int,
+              stats: Stats, fin: float,
+              control: Optional[Control] = None, best: Optional[dict] = None):
+    """
+    Hill climbing de primera mejora sobre p (p[0] = anchor, nunca se mueve).
+    Cada movimiento se evalúa en O(1) mirando solo las aristas que cambian.
+    Devuelve (p, agotado) donde agotado = se cumplió el deadline o el control
+    pidió cortar.
+    """
+    def cortar() -> bool:
+        if time.perf_counter() >= fin:
+            return True
+        return control is not None and control.chequear(stats, best, stats.moves_evaluated)
+
+    mejora = True
+    while mejora:
+        mejora = False
+
+        # 2-opt: invertir p[i+1..j] cambia (a,b),(c,d) por (a,c),(b,d)
+        for i in range(n - 2):
+            a, b = p[i], p[i+1]
+            # i=0, j=n-1 sería el mismo anillo reflejado
+            for j in range(i + 2, n - (i == 0)):
+                c, d = p[j], p[(j+1) % n]
+                stats.moves_evaluated += 1
+                if stats.moves_evaluated % CHEQUEO_RELOJ == 0 and cortar():
+                    return p, True
+                delta = Wp[a][c] + Wp[b][d] - Wp[a][b] - Wp[c][d]
+                if delta > 0:
+                    p[i+1:j+1] = p[i+1:j+1][::-1]
+                    stats.moves_applied += 1
+                    mejora = True
+                    break
+            if mejora:
+                break
+        if mejora:
+            continue
+
+        # Or-opt: mover un tramo p[i..i+L-1] (L=1..or_max) entre (x, y)
+        for L in range(1, or_max + 1):
+            for i in range(1, n - L + 1):
+                s0, sL = p[i], p[i+L-1]
+                prev, nxt = p[i-1], p[(i+L) % n]
+                quitar = Wp[prev][nxt] - Wp[prev][s0] - Wp[sL][nxt]
+                for k in range(n):
+                    if i - 1 <= k <= i + L - 1:
+                        continue
+                    x, y = p[k], p[(k+1) % n]
+                    stats.moves_evaluated += 1
+                    if stats.moves_evaluated % CHEQUEO_RELOJ == 0 and cortar():
+                        return p, True
+                    directo = Wp[x][s0] + Wp[sL][y]
+                    invertido = Wp[x][sL] + Wp[s0][y]
+                    delta = quitar + max(directo, invertido) - Wp[x][y]
+                    if delta > 0:
+                        tramo = p[i:i+L] if directo >= invertido else p[i:i+L][::-1]
+                        resto = p[:i] + p[i+L:]
+                        pos = resto.index(x) + 1
+                        p[:] = resto[:pos] + tramo + resto[pos:]
+                        stats.moves_applied += 1
+                        mejora = True
+                        break
+                if mejora:
+                    break
+            if mejora:
+                break
+
+    return p, cortar()
+
+
+def _inicial_aleatoria(rng: np.random.Generator, anchor: int, otros: np.ndarray,
+                       W: np.ndarray, muestras: int) -> list[int]:
+    """Mejor de 'muestras' anillos aleatorios (evaluados en bloque)."""
+    G = rng.permuted(np.tile(otros, (muestras, 1)), axis=1)
+    P = np.hstack([np.full((muestras, 1), anchor), G])
+    scores, factible = evaluate_batch(P, W)
+    i = int(np.argmax(np.where(factible, scores, scores - W.size * (W.max(initial=0) + 1))))
+    return P[i].tolist()
+
+
+def solve_local_search(rooms: List[str],
+                       A: List[List[int]],
+                       anchor_room: Optional[str] = None,
+                       tiempo_limite: float = 0.2,
+                       reinicios: Optional[int] = None,
+                       perm_inicial: Optional[List[int]] = None,
+                       or_max: int = 3,
+                       muestras: int = 64,
+                       semilla: Optional[int] = None,
+                       cancelacion: Optional[Cancelacion] = None,
+                       progreso: Optional[Callable[[dict], None]] = None,
+                       intervalo_progreso: int = 100_000):
+    """
+    Solver anytime por búsqueda local sobre el anillo de evaluate_perm.
+    - Movimientos 2-opt y Or-opt (tramos de 1..or_max salas) con delta O(1).
+    - Aristas A=0 se reemplazan por una penalización mayor a cualquier puntaje,
+      así el descenso se aleja de layouts infactibles.
+    - Tras cada óptimo local reinicia desde el mejor de 'muestras' anillos
+      aleatorios, hasta 'reinicios' veces o hasta 'tiempo_limite' segundos; al
+      cumplirse el deadline devuelve el mejor factible encontrado.
+    - perm_inicial: punto de partida (p. ej. el incumbente de un
+      solve_backtracking cortado antes de tiempo) para pulirlo.
+    - cancelacion corta la búsqueda (stats.timed_out = True); progreso(dict) se
+      llama cada 'intervalo_progreso' movimientos evaluados y al terminar.
+    Devuelve (perm, score, stats) como solve_backtracking.
+    """
+    inicio = time.perf_counter()
+    fin = inicio + tiempo_limite
+
+    n = len(rooms)
+    idx = {r: i for i, r in enumerate(rooms)}
+    if anchor_room is None:
+        anchor_room = rooms[0]
+    anchor = idx[anchor_room]
+
+    stats = Stats()
+    W = np.asarray(A, dtype=np.int64)
+    penalizacion = n * int(np.abs(W).max(initial=0)) + 1
+    Wp = np.where(W != 0, W, -penalizacion).tolist()
+    otros = np.array([i for i in range(n) if i != anchor], dtype=np.intp)
+    rng = np.random.default_rng(semilla)
+
+    if perm_inicial is not None:
+        k = perm_inicial.index(anchor)
+        p = list(perm_inicial[k:]) + list(perm_inicial[:k])
+    else:
+        p = _inicial_aleatoria(rng, anchor, otros, W, muestras)
+
+    control = None
+    if cancelacion is not None or progreso is not None:
+        control = Control(cancelacion=cancelacion, progreso=progreso,
+                          intervalo_progreso=intervalo_progreso)
+
+    best = {"score": -10**9, "perm": None}
+    while True:
+        p, agotado = _descenso(p, Wp, n, or_max, stats, fin, control, best)
+        stats.nodes_expanded += 1
+
+        factible = all(A[p[i]][p[(i+1) % n]] != 0 for i in range(n))
+        if factible:
+            stats.leaves_feasible += 1
+            score = evaluate_perm(p, A)
+            if score > best["score"]:
+                best["score"] = score
+                best["perm"] = p.copy()
+        else:
+            stats.leaves_infeasible += 1
+
+        if agotado or (reinicios is not None and stats.restarts >= reinicios):
+            break
+        stats.restarts += 1
+        p = _inicial_aleatoria(rng, anchor, otros, W, muestras)
+
+    if control is not None:
+        control.reportar(stats, best)
+    return best["perm"], best["score"], stats
@@ -0,0 +1,154 @@
+# ----------------------------
+# Cache de soluciones
+# ----------------------------
+import copy
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+import numpy as np
+
+
+def huella_instancia(solver: Callable,
+                     rooms: List[str],
+                     A,
+                     anchor_room: Optional[str],
+                     opciones: dict) -> str:
+    """
+    Hash canónico de una instancia: no depende del orden en que vienen las
+    salas (se ordenan por nombre y A se permuta igual), sí del solver, del
+    anchor y de las opciones.
+    """
+    orden = sorted(range(len(rooms)), key=lambda i: rooms[i])
+    W = np.asarray(A, dtype=np.int64)[np.ix_(orden, orden)]
+    if anchor_room is None:
+        anchor_room = rooms[0]
+
+    h = hashlib.sha256()
+    h.update(f"{solver.__module__}.{solver.__qualname__}".encode())
+    h.update(json.dumps([rooms[i] for i in orden]).encode())
+    h.update(W.tobytes())
+    h.update(json.dumps(anchor_room).encode())
+    h.update(json.dumps(opciones, sort_keys=True, default=repr).encode())
+    return h.hexdigest()
+
+
+class CacheSoluciones:
+    """
+    Cache delante de cualquier solver con contrato (perm, score, Stats):
+      - memoria: LRU de 'capacidad' entradas
+      - disco (opcional): SQLite en 'ruta', sobrevive reinicios
+    La perm se guarda por nombre de sala, así una misma instancia con las
+    salas en otro orden también es un hit.
+    Contadores: hits, disk_hits, misses y segundos de solver ahorrados.
+    """
+
+    def __init__(self, capacidad: int = 256, ruta: Optional[str] = None) -> None:
+        self.capacidad = capacidad
+        self._memoria: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if ruta is not None:
+            self._db = sqlite3.connect(ruta, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS soluciones (clave TEXT PRIMARY KEY, valor BLOB)")
+            self._db.commit()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.tiempo_ahorrado = 0.0
+
+    def _buscar(self, clave: str):
+        with self._lock:
+            if clave in self._memoria:
+                self._memoria.move_to_end(clave)
+                self.hits += 1
+                return self._memoria[clave]
+            if self._db is not None:
+                fila = self._db.execute(
+                    "SELECT valor FROM soluciones WHERE clave = ?", (clave,)).fetchone()
+                if fila is not None:
+                    entrada = pickle.loads(fila[0])
+                    self._guardar_memoria(clave, entrada)
+                    self.disk_hits += 1
+                    return entrada
+            self.misses += 1
+            return None
+
+    def _guardar_memoria(self, clave: str, entrada: tuple) -> None:
+        self._memoria[clave] = entrada
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.capacidad:
+            self._memoria.popitem(last=False)
+
+    def _guardar(self, clave: str, entrada: tuple) -> None:
+        with self._lock:
+            self._guardar_memoria(clave, entrada)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO soluciones VALUES (?, ?)",
+                                 (clave, pickle.dumps(entrada)))
+                self._db.commit()
+
+    def buscar(self, clave: str, rooms: List[str]):
+        """(perm, score, stats) guardado para 'clave' con índices de 'rooms', o None."""
+        entrada = self._buscar(clave)
+        if entrada is None:
+            return None
+        perm_nombres, score, stats, segundos = entrada
+        with self._lock:
+            self.tiempo_ahorrado += segundos
+        idx = {r: i for i, r in enumerate(rooms)}
+        perm = None if perm_nombres is None else [idx[r] for r in perm_nombres]
+        return perm, score, copy.deepcopy(stats)
+
+    def guardar(self, clave: str, rooms: List[str], perm, score, stats, segundos: float) -> None:
+        """Guarda un resultado; los cortados por deadline/cancelación no se cachean."""
+        if getattr(stats, "timed_out", False):
+            return
+        perm_nombres = None if perm is None else [rooms[i] for i in perm]
+        self._guardar(clave, (perm_nombres, score, copy.deepcopy(stats), segundos))
+
+    def resolver(self,
+                 solver: Callable,
+                 rooms: List[str],
+                 A,
+                 anchor_room: Optional[str] = None,
+                 **opciones):
+        """solver(rooms, A, anchor_room, **opciones) con cache."""
+        clave = huella_instancia(solver, rooms, A, anchor_room, opciones)
+        cacheado = self.buscar(clave, rooms)
+        if cacheado is not None:
+            return cacheado
+
+        inicio = time.perf_counter()
+        perm, score, stats = solver(rooms, A, anchor_room, **opciones)
+        self.guardar(clave, rooms, perm, score, stats, time.perf_counter() - inicio)
+        return perm, score, stats
+
+    def contadores(self) -> dict:
+        consultas = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.disk_hits) / consultas if consultas else 0.0,
+            "tiempo_ahorrado": self.tiempo_ahorrado,
+            "entradas": len(self._memoria),
+        }
+
+    def limpiar(self) -> None:
+        with self._lock:
+            self._memoria.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM soluciones")
+                self._db.commit()
+
+
+# Cache compartida del proceso (la usa la API)
+cache_soluciones = CacheSoluciones()
@@ -0,0 +1,89 @@
+# ----------------------------
+# Control de ejecución: deadline, presupuesto, cancelación y progreso
+# ----------------------------
+import threading
+import time
+from typing import Callable, Optional
+
+from logica.algoritmo.genetico import Stats
+
+
+class Cancelacion:
+    """
+    Token de cancelación cooperativa. Por defecto usa un threading.Event; para
+    cancelar desde otro proceso se le puede pasar un Event de multiprocessing
+    (o de un Manager).
+    """
+
+    def __init__(self, evento=None) -> None:
+        self._evento = evento if evento is not None else threading.Event()
+
+    def cancelar(self) -> None:
+        self._evento.set()
+
+    @property
+    def cancelado(self) -> bool:
+        return self._evento.is_set()
+
+
+class Control:
+    """
+    Presupuestos de una corrida de solver:
+      - tiempo_limite: segundos de reloj desde que se crea el Control
+      - max_nodos: tope del contador que pasa el solver (nodos, individuos...)
+      - cancelacion: Cancelacion cooperativa
+      - progreso: callback(dict) cada 'intervalo_progreso' unidades del contador
+    Los solvers solo comparan su contador con 'proximo' (una comparación por
+    nodo) y llaman a chequear() cuando lo alcanzan; chequear() mira el reloj y
+    la cancelación, reporta progreso y deja Stats.timed_out = True si hay que
+    cortar.
+    """
+
+    def __init__(self,
+                 tiempo_limite: Optional[float] = None,
+                 max_nodos: Optional[int] = None,
+                 cancelacion: Optional[Cancelacion] = None,
+                 progreso: Optional[Callable[[dict], None]] = None,
+                 intervalo_progreso: int = 10_000,
+                 intervalo_chequeo: int = 1024) -> None:
+        self.inicio = time.perf_counter()
+        self.fin = None if tiempo_limite is None else self.inicio + tiempo_limite
+        self.max_nodos = max_nodos
+        self.cancelacion = cancelacion
+        self.progreso = progreso
+        self.intervalo_progreso = intervalo_progreso
+        self.intervalo_chequeo = intervalo_chequeo
+        self._proximo_progreso = intervalo_progreso
+        self.proximo = 0
+
+    def reportar(self, stats: Stats, best: dict) -> None:
+        if self.progreso is None:
+            return
+        self.progreso({
+            "nodes_expanded": stats.nodes_expanded,
+            "best_score": best["score"],
+            "best_perm": best["perm"],
+            "depth_expansions": dict(sorted(stats.depth_expansions.items())),
+            "elapsed": time.perf_counter() - self.inicio,
+            "timed_out": stats.timed_out,
+        })
+
+    def chequear(self, stats: Stats, best: dict, contador: int) -> bool:
+        """True si hay que detener la búsqueda."""
+        if self.progreso is not None and contador >= self._proximo_progreso:
+            self.reportar(stats, best)
+            while self._proximo_progreso <= contador:
+                self._proximo_progreso += self.intervalo_progreso
+
+        detener = ((self.max_nodos is not None and contador >= self.max_nodos)
+                   or (self.cancelacion is not None and self.cancelacion.cancelado)
+                   or (self.fin is not None and time.perf_counter() >= self.fin))
+        if detener:
+            stats.timed_out = True
+
+        self.proximo = contador + self.intervalo_chequeo
+        if self.progreso is not None:
+            self.proximo = min(self.proximo, self._proximo_progreso)
+        if self.max_nodos is not None:
+            self.proximo = min(self.proximo, self.max_nodos)
+        return detener
@@ -0,0 +1,56 @@
+from typing import List, Tuple
+
+import numpy as np
+
+
+def evaluate_perm(perm: List[int], A: List[List[int]]) -> int:
+    """Suma de compatibilidades entre vecinos del anillo (circular)."""
+    n = len(perm)
+    s = 0
+    for i in range(n):
+        j = (i+1) % n
+        s += A[perm[i]][perm[j]]
+    return s
+
+
+def ring_edges(P: np.ndarray, A: np.ndarray) -> np.ndarray:
+    """Pesos (k, n) de las aristas i → i+1 (circular) de cada anillo de P."""
+    return A[P, np.roll(P, -1, axis=1)]
+
+
+def evaluate_batch(P, A) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    evaluate_perm para muchas permutaciones de una vez.
+    P: (k, n) enteros (o una sola permutación 1-D), A: matriz NxN (lista o ndarray).
+    Devuelve (scores, factible) donde factible[i] = ninguna arista del anillo i
+    tiene A=0.
+    """
+    P = np.atleast_2d(np.asarray(P, dtype=np.intp))
+    pesos = ring_edges(P, np.asarray(A))
+    return pesos.sum(axis=1), (pesos != 0).all(axis=1)
+
+
+def evaluate_population(P: np.ndarray, A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Versión vectorizada de evaluate_perm para una población completa.
+    P: (pop, n) índices de sala por slot. Devuelve (scores, ceros) donde
+    ceros = cantidad de aristas del anillo con A=0 (prohibidas) por fila.
+    """
+    pesos = ring_edges(P, A)
+    return pesos.sum(axis=1), (pesos == 0).sum(axis=1)
+
+
+def evaluate_grid(S, A, aristas) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Puntaje de asignaciones sala -> celda sobre un grafo de celdas (p. ej. las
+    adyacencias de un piso hexagonal).
+    S: (k, m) sala en cada celda (-1 = celda vacía) o una sola fila 1-D.
+    aristas: (E, 2) pares de celdas vecinas. Solo cuentan aristas con salas en
+    ambas celdas. Devuelve (scores, factible) como evaluate_batch.
+    """
+    S = np.atleast_2d(np.asarray(S, dtype=np.intp))
+    aristas = np.asarray(aristas, dtype=np.intp).reshape(-1, 2)
+    a, b = S[:, aristas[:, 0]], S[:, aristas[:, 1]]
+    ocupadas = (a >= 0) & (b >= 0)
+    pesos = np.where(ocupadas, np.asarray(A)[a, b], 0)
+    return pesos.sum(axis=1), ~(ocupadas & (pesos == 0)).any(axis=1)
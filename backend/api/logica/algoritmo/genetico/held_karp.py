@@ -0,0 +1,134 @@
+# ----------------------------
+# Held–Karp (DP sobre subconjuntos)
+# ----------------------------
+from typing import List, Optional
+
+import numpy as np
+
+from logica.algoritmo.genetico import Stats
+
+
+def _popcount(x: np.ndarray) -> np.ndarray:
+    """Cantidad de bits en 1 de cada máscara (uint32)."""
+    x = x - ((x >> 1) & 0x55555555)
+    x = (x & 0x33333333) + ((x >> 2) & 0x33333333)
+    x = (x + (x >> 4)) & 0x0F0F0F0F
+    return (x * 0x01010101 & 0xFFFFFFFF) >> 24
+
+
+def solve_held_karp(rooms: List[str],
+                    A: List[List[int]],
+                    anchor_room: Optional[str] = None,
+                    memoria_max: int = 1 << 30,
+                    chunk_bytes: int = 1 << 25):
+    """
+    Solver exacto: máximo ciclo hamiltoniano sobre A (A=0 ⇒ arista prohibida).
+    - Fija anchor_room en slot 0 (igual que solve_backtracking).
+    - dp[mask][j] = mejor camino anchor → ... → j recorriendo exactamente 'mask'
+      (máscara sobre las N-1 salas restantes). Se llena por capas de popcount,
+      vectorizado por sala destino j y en bloques de 'chunk_bytes'.
+    - La tabla usa int16 si el puntaje máximo posible cabe, si no int32.
+      Si la tabla supera 'memoria_max' bytes se lanza MemoryError.
+    - Stats: nodes_expanded = estados (mask, j), children_generated = transiciones,
+      children_valid / children_pruned_zero = estados alcanzables / inalcanzables
+      por A=0, leaves_* = cierres del anillo, depth_expansions = estados por capa.
+    Devuelve (perm, score, stats) con el mismo contrato que solve_backtracking.
+    """
+    n = len(rooms)
+    idx = {r: i for i, r in enumerate(rooms)}
+    if anchor_room is None:
+        anchor_room = rooms[0]
+    anchor = idx[anchor_room]
+
+    stats = Stats()
+    W = np.asarray(A, dtype=np.int64)
+    otros = [i for i in range(n) if i != anchor]
+    m = len(otros)
+
+    if m == 0:
+        return None, -10**9, stats
+
+    max_score = n * int(np.abs(W).max(initial=0))
+    dtype = np.int16 if 2 * max_score < 8000 else np.int32
+    NEG = int(np.iinfo(dtype).min) // 2
+
+    n_masks = 1 << m
+    stats.dp_table_size = n_masks * m
+    tabla_bytes = stats.dp_table_size * np.dtype(dtype).itemsize
+    if tabla_bytes > memoria_max:
+        raise MemoryError(
+            f"Tabla DP de {tabla_bytes} bytes supera memoria_max={memoria_max}")
+
+    # Pesos entre salas no-ancla; A=0 (o i==j) ⇒ NEG (transición prohibida)
+    sub = W[np.ix_(otros, otros)]
+    Wo = np.where(sub != 0, sub, NEG).astype(np.int32)
+    np.fill_diagonal(Wo, NEG)
+    desde_anchor = W[anchor, otros]
+    hacia_anchor = W[otros, anchor]
+
+    dp = np.full((n_masks, m), NEG, dtype=dtype)
+    for j in range(m):
+        if desde_anchor[j] != 0:
+            dp[1 << j, j] = desde_anchor[j]
+
+    stats.nodes_expanded += m
+    stats.children_generated += m
+    stats.children_valid += int(np.count_nonzero(desde_anchor))
+    stats.children_pruned_zero += m - int(np.count_nonzero(desde_anchor))
+    stats.depth_expansions[1] = m
+
+    # Máscaras agrupadas por popcount (capa = cantidad de salas ya colocadas)
+    masks = np.arange(n_masks, dtype=np.uint32)
+    pc = _popcount(masks)
+    orden = np.argsort(pc, kind="stable").astype(np.uint32)
+    cortes = np.cumsum(np.bincount(pc, minlength=m + 1))
+
+    chunk = max(1, chunk_bytes // (m * 4))
+    pico_tmp = 0
+    for s in range(2, m + 1):
+        capa = orden[cortes[s - 1]:cortes[s]]
+        stats.depth_expansions[s] = len(capa) * s
+        for j in range(m):
+            bit = np.uint32(1 << j)
+            Lj = capa[(capa & bit) != 0]
+            for ini in range(0, len(Lj), chunk):
+                bloque = Lj[ini:ini + chunk]
+                prev = bloque ^ bit
+                tmp = dp[prev].astype(np.int32) + Wo[:, j]
+                pico_tmp = max(pico_tmp, tmp.nbytes + prev.nbytes)
+                res = tmp.max(axis=1)
+                validos = res > NEG // 2
+                dp[bloque, j] = np.where(validos, res, NEG)
+
+                stats.nodes_expanded += len(bloque)
+                stats.children_generated += len(bloque) * (s - 1)
+                nv = int(np.count_nonzero(validos))
+                stats.children_valid += nv
+                stats.children_pruned_zero += len(bloque) - nv
+
+    stats.dp_peak_bytes = tabla_bytes + pico_tmp + masks.nbytes + orden.nbytes + pc.nbytes
+
+    # Cierre del anillo: último → anchor
+    full = n_masks - 1
+    finales = dp[full].astype(np.int64)
+    cierre_ok = (finales > NEG // 2) & (hacia_anchor != 0)
+    stats.leaves_feasible = int(np.count_nonzero(cierre_ok))
+    stats.leaves_infeasible = m - stats.leaves_feasible
+    if not cierre_ok.any():
+        return None, -10**9, stats
+
+    totales = np.where(cierre_ok, finales + hacia_anchor, np.iinfo(np.int64).min)
+    j = int(np.argmax(totales))
+    best_score = int(totales[j])
+
+    # Reconstrucción hacia atrás sin tabla de padres
+    camino = [j]
+    mask = full
+    while mask & (mask - 1):
+        prev = mask ^ (1 << j)
+        k = int(np.argmax(dp[prev].astype(np.int32) + Wo[:, j]))
+        camino.append(k)
+        mask, j = prev, k
+
+    perm = [anchor] + [otros[k] for k in reversed(camino)]
+    return perm, best_score, stats
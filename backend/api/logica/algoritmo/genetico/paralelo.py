@@ -0,0 +1,126 @@
+# ----------------------------
+# Backtracking paralelo (multi-proceso)
+# ----------------------------
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from logica.algoritmo.genetico import Stats
+from logica.algoritmo.genetico.backtracking import (backtrack_iterativo, cotas_iniciales,
+                                                    exigir_simetrica, ordenar_candidatos,
+                                                    solve_backtracking)
+
+# Estado de cada worker (lo carga el initializer una sola vez por proceso)
+_worker: dict = {}
+
+
+def _init_worker(compartido, A, n, orden, vecinos, cota, simetria):
+    _worker.update(compartido=compartido, A=A, n=n, orden=orden,
+                   vecinos=vecinos, cota=cota, simetria=simetria)
+
+
+def _resolver_prefijo(tarea):
+    """Corre el DFS iterativo bajo un prefijo fijo de slots."""
+    slots, pos, mask, score = tarea
+    n = _worker["n"]
+    cota = None
+    if _worker["cota"] is not None:
+        top1, top2 = _worker["cota"]["top1"], _worker["cota"]["top2"]
+        cota = {"top1": top1, "top2": top2,
+                "top2_restantes": sum(top2[r] for r in range(n) if (mask >> r) & 1)}
+
+    stats = Stats()
+    best = {"score": -10**9, "perm": None}
+    backtrack_iterativo(stats, slots, pos, mask, score, _worker["A"], n,
+                        _worker["orden"], _worker["vecinos"], best, cota,
+                        compartido=_worker["compartido"],
+                        simetria=_worker["simetria"])
+    return best["perm"], best["score"], stats
+
+
+def _prefijos(stats: Stats, A, n: int, orden, vecinos, slots: list[int], pos: int,
+              mask: int, score: int, hasta: int, salida: list):
+    """
+    Expande en el proceso principal los slots pos..hasta-1 (mismo orden y mismos
+    contadores que el DFS) y deja en 'salida' un subárbol por prefijo.
+    """
+    anchor = slots[0]
+    prev = slots[pos-1]
+    stats.nodes_expanded += 1
+    stats.depth_expansions[pos] = stats.depth_expansions.get(pos, 0) + 1
+    libres = n - pos
+    stats.children_generated += libres
+    stats.children_pruned_zero += libres - (mask & vecinos[prev]).bit_count()
+
+    for r in orden[prev]:
+        if not (mask >> r) & 1:
+            continue
+        if pos == n-1 and A[r][anchor] == 0:
+            continue
+        stats.children_valid += 1
+        hijo = slots.copy()
+        hijo[pos] = r
+        if pos + 1 < hasta:
+            _prefijos(stats, A, n, orden, vecinos, hijo, pos+1, mask ^ (1 << r),
+                      score + A[prev][r], hasta, salida)
+        else:
+            salida.append((hijo, pos+1, mask ^ (1 << r), score + A[prev][r]))
+
+
+def solve_backtracking_paralelo(rooms: List[str],
+                                A: List[List[int]],
+                                anchor_room: Optional[str] = None,
+                                bound: bool = True,
+                                workers: Optional[int] = None,
+                                profundidad: int = 1,
+                                simetria: bool = False):
+    """
+    solve_backtracking repartido en un ProcessPoolExecutor.
+    - Particiona el árbol en los slots 1..profundidad (1 o 2): cada prefijo
+      factible es una tarea, en el mismo orden en que el DFS serie los visita.
+    - Con bound=True los workers comparten el mejor puntaje en un
+      multiprocessing.Value: una mejora en uno poda en todos.
+    - Se queda con el mayor puntaje y, ante empate, con el primer prefijo en
+      orden DFS ⇒ mismo (perm, score) que solve_backtracking.
+    - Stats = expansión de prefijos + suma de los Stats de todos los workers.
+    - simetria: igual que en solve_backtracking (se aplica en el último slot;
+      exige A simétrica y no suma con bound=True).
+    """
+    n = len(rooms)
+    if simetria:
+        exigir_simetrica(A, n)
+    if profundidad < 1 or profundidad > n - 2:
+        # Nada que repartir: el árbol es trivial
+        return solve_backtracking(rooms, A, anchor_room, bound=bound, simetria=simetria)
+
+    idx = {r: i for i, r in enumerate(rooms)}
+    if anchor_room is None:
+        anchor_room = rooms[0]
+    anchor = idx[anchor_room]
+
+    slots = [-1]*n
+    slots[0] = anchor
+    remaining = [i for i in range(n) if i != anchor]
+
+    zeros_count = [sum(1 for j in range(n) if A[i][j] == 0) for i in range(n)]
+    orden, vecinos = ordenar_candidatos(A, n, zeros_count)
+    cota = cotas_iniciales(A, n, remaining) if bound else None
+
+    stats = Stats()
+    tareas: list = []
+    mask = sum(1 << r for r in remaining)
+    _prefijos(stats, A, n, orden, vecinos, slots, 1, mask, 0, 1 + profundidad, tareas)
+
+    compartido = mp.Value("q", -10**9) if bound else None
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(compartido, A, n, orden, vecinos, cota,
+                                       simetria)) as pool:
+        resultados = list(pool.map(_resolver_prefijo, tareas))
+
+    best_perm, best_score = None, -10**9
+    for perm, score, s in resultados:
+        stats.merge(s)
+        if score > best_score:
+            best_perm, best_score = perm, score
+    return best_perm, best_score, stats
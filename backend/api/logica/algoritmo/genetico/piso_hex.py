@@ -0,0 +1,149 @@
+# ----------------------------
+# Layout sobre un piso hexagonal (búsqueda local por swaps)
+# ----------------------------
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from logica.algoritmo.genetico import Stats
+from logica.algoritmo.genetico.control import Cancelacion, Control
+from logica.algoritmo.genetico.evaluacion import evaluate_grid
+from logica.objetos.indice_hex import IndiceHex
+
+# Cada cuántas evaluaciones se mira el reloj
+CHEQUEO_RELOJ = 512
+
+
+def _descenso(s: list[int], vecinos: list[list[int]], libres: list[int],
+              Wp: list[list[int]], stats: Stats, fin: float,
+              control: Optional[Control] = None, best: Optional[dict] = None):
+    """
+    Barridos de swaps sobre s (s[c] = sala en la celda c; la sala 'vacía' es
+    la última fila de Wp, con peso 0 contra todo): se aplica cada swap que
+    mejora y se repite hasta un barrido sin mejoras.
+    Un swap de las celdas a, b solo cambia las aristas de a y de b, así que el
+    delta se calcula en O(grado). Devuelve (s, agotado) como en busqueda_local.
+    """
+    def cortar() -> bool:
+        if time.perf_counter() >= fin:
+            return True
+        return control is not None and control.chequear(stats, best, stats.moves_evaluated)
+
+    mejora = True
+    while mejora:
+        mejora = False
+        for ia, a in enumerate(libres):
+            x = s[a]
+            for b in libres[ia + 1:]:
+                y = s[b]
+                if x == y:  # dos celdas vacías
+                    continue
+                stats.moves_evaluated += 1
+                if stats.moves_evaluated % CHEQUEO_RELOJ == 0 and cortar():
+                    return s, True
+                Wx, Wy = Wp[x], Wp[y]
+                delta = 0
+                for c in vecinos[a]:
+                    if c != b:
+                        delta += Wy[s[c]] - Wx[s[c]]
+                for c in vecinos[b]:
+                    if c != a:
+                        delta += Wx[s[c]] - Wy[s[c]]
+                if delta > 0:
+                    s[a], s[b] = y, x
+                    x = y
+                    stats.moves_applied += 1
+                    mejora = True
+
+    return s, cortar()
+
+
+def solve_piso_hex(rooms: List[str],
+                   A: List[List[int]],
+                   indice: IndiceHex,
+                   anchor_room: Optional[str] = None,
+                   anchor_celda: int = 0,
+                   tiempo_limite: float = 0.5,
+                   reinicios: Optional[int] = None,
+                   semilla: Optional[int] = None,
+                   cancelacion: Optional[Cancelacion] = None,
+                   progreso: Optional[Callable[[dict], None]] = None,
+                   intervalo_progreso: int = 100_000):
+    """
+    Asigna salas a las celdas de un piso hexagonal (IndiceHex, p. ej.
+    Piso(...).indice()) maximizando la suma de A sobre todas las celdas que
+    comparten un lado; un par con A=0 en celdas vecinas hace el layout
+    infactible. Con menos salas que celdas sobran celdas vacías.
+    - anchor_room queda fija en anchor_celda (por defecto la central).
+    - Swaps de dos celdas (o sala <-> celda vacía) con delta incremental
+      O(grado); tras cada óptimo local reinicia desde una asignación aleatoria
+      hasta 'reinicios' veces o 'tiempo_limite' segundos.
+    - A=0 se reemplaza por una penalización mayor a cualquier puntaje, como en
+      solve_local_search; cancelacion/progreso igual que ahí.
+    Devuelve (asignacion, score, stats): asignacion[c] = índice de sala en la
+    celda c, o None si quedó vacía.
+    """
+    inicio = time.perf_counter()
+    fin = inicio + tiempo_limite
+
+    n, m = len(rooms), len(indice)
+    if n > m:
+        raise ValueError(f"{n} salas no caben en {m} celdas")
+    idx = {r: i for i, r in enumerate(rooms)}
+    if anchor_room is None:
+        anchor_room = rooms[0]
+    anchor = idx[anchor_room]
+
+    stats = Stats()
+    W = np.asarray(A, dtype=np.int64)
+    penalizacion = 6 * m * int(np.abs(W).max(initial=0)) + 1
+    # fila/columna extra (índice n) = celda vacía, no suma ni resta
+    Wp = np.zeros((n + 1, n + 1), dtype=np.int64)
+    Wp[:n, :n] = np.where(W != 0, W, -penalizacion)
+    np.fill_diagonal(Wp[:n, :n], 0)
+    Wp = Wp.tolist()
+
+    vecinos = [fila[fila >= 0].tolist() for fila in indice.vecinos_array]
+    aristas = indice.adyacencias()
+    libres = [c for c in range(m) if c != anchor_celda]
+    contenido = np.array([i for i in range(n) if i != anchor] + [n] * (m - n), dtype=np.int64)
+    rng = np.random.default_rng(semilla)
+
+    def aleatoria() -> list[int]:
+        s = [0] * m
+        s[anchor_celda] = anchor
+        for c, sala in zip(libres, rng.permutation(contenido).tolist()):
+            s[c] = sala
+        return s
+
+    control = None
+    if cancelacion is not None or progreso is not None:
+        control = Control(cancelacion=cancelacion, progreso=progreso,
+                          intervalo_progreso=intervalo_progreso)
+
+    best = {"score": -10**9, "perm": None}
+    s = aleatoria()
+    while True:
+        s, agotado = _descenso(s, vecinos, libres, Wp, stats, fin, control, best)
+        stats.nodes_expanded += 1
+
+        fila = np.where(np.asarray(s) == n, -1, s)
+        score, factible = evaluate_grid(fila, W, aristas)
+        if factible[0]:
+            stats.leaves_feasible += 1
+            if score[0] > best["score"]:
+                best["score"] = int(score[0])
+                best["perm"] = fila.tolist()
+        else:
+            stats.leaves_infeasible += 1
+
+        if agotado or (reinicios is not None and stats.restarts >= reinicios):
+            break
+        stats.restarts += 1
+        s = aleatoria()
+
+    if control is not None:
+        control.reportar(stats, best)
+    asignacion = None if best["perm"] is None else [None if i < 0 else i for i in best["perm"]]
+    return asignacion, best["score"], stats
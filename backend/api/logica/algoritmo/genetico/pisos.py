@@ -0,0 +1,205 @@
+# ----------------------------
+# Varios pisos: partición de salas + layout de cada piso en paralelo
+# ----------------------------
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from logica.algoritmo.genetico import Stats
+from logica.algoritmo.genetico.algoritmo_genetico import solve_genetico
+from logica.algoritmo.genetico.backtracking import solve_backtracking
+from logica.algoritmo.genetico.busqueda_local import solve_local_search
+from logica.algoritmo.genetico.evaluacion import evaluate_perm
+from logica.algoritmo.genetico.held_karp import solve_held_karp
+
+# Regla de la planta baja: el airlock va en el piso 0 y es su ancla
+AIRLOCK = "EVA-3 (Airlock) / Suit Donning & Pressurization"
+
+# Solvers de anillo (puntaje de evaluate_perm): con ellos los pisos de 1 o 2
+# salas se puntúan sin llamarlos (ver _piso_chico)
+SOLVERS_ANILLO = (solve_backtracking, solve_held_karp, solve_genetico, solve_local_search)
+
+
+def particionar(rooms: List[str],
+                A: List[List[int]],
+                capacidades: List[int],
+                fijas: Optional[Dict[str, int]] = None,
+                castigo_cero: Optional[int] = None) -> List[List[str]]:
+    """
+    Reparte las salas en len(capacidades) pisos (a lo sumo capacidades[f]
+    salas en el piso f) maximizando la afinidad dentro de cada piso: la suma
+    de A entre salas del mismo piso, donde un par con A=0 resta castigo_cero
+    (por defecto el peso máximo de A).
+    - fijas: {sala: piso} que no se mueven (p. ej. {AIRLOCK: 0}).
+    - Arranque goloso (salas de mayor afinidad total primero, al piso que más
+      suma con lugar libre) y después movidas/intercambios entre pisos con
+      ganancia incremental hasta que ninguno mejora.
+    Devuelve las salas de cada piso en el orden de 'rooms'.
+    """
+    n, F = len(rooms), len(capacidades)
+    if sum(capacidades) < n:
+        raise ValueError(f"{n} salas no caben en pisos de capacidad {capacidades}")
+    idx = {r: i for i, r in enumerate(rooms)}
+    fijas = {idx[r]: f for r, f in (fijas or {}).items() if r in idx}
+
+    W = np.asarray(A, dtype=np.int64)
+    if castigo_cero is None:
+        castigo_cero = int(W.max(initial=1))
+    Wp = np.where(W != 0, W, -castigo_cero)
+    np.fill_diagonal(Wp, 0)
+
+    piso = np.full(n, -1, dtype=np.intp)
+    libres = np.array(capacidades, dtype=np.intp)
+    # afinidad[i, f] = suma de Wp entre la sala i y las salas del piso f
+    afinidad = np.zeros((n, F), dtype=np.int64)
+
+    def poner(i: int, f: int) -> None:
+        piso[i] = f
+        libres[f] -= 1
+        afinidad[:, f] += Wp[:, i]
+
+    def sacar(i: int) -> None:
+        f = piso[i]
+        libres[f] += 1
+        afinidad[:, f] -= Wp[:, i]
+
+    for i, f in fijas.items():
+        if libres[f] <= 0:
+            raise ValueError(f"El piso {f} no tiene lugar para las salas fijas")
+        poner(i, f)
+
+    for i in np.argsort(-Wp.sum(axis=1), kind="stable").tolist():
+        if piso[i] < 0:
+            candidatos = np.flatnonzero(libres > 0)
+            poner(i, int(candidatos[np.argmax(afinidad[i, candidatos])]))
+
+    moviles = [i for i in range(n) if i not in fijas]
+    mejora = True
+    while mejora:
+        mejora = False
+        for x in moviles:
+            f = piso[x]
+            for g in range(F):
+                if g == f:
+                    continue
+                if libres[g] > 0 and afinidad[x, g] - afinidad[x, f] > 0:
+                    sacar(x)
+                    poner(x, g)
+                    mejora = True
+                    break
+                # intercambio con una sala y del piso g
+                for y in moviles:
+                    if piso[y] != g:
+                        continue
+                    ganancia = (afinidad[x, g] - afinidad[x, f]
+                                + afinidad[y, f] - afinidad[y, g] - 2 * Wp[x, y])
+                    if ganancia > 0:
+                        sacar(x)
+                        sacar(y)
+                        poner(x, g)
+                        poner(y, f)
+                        mejora = True
+                        break
+                if piso[x] != f:
+                    break
+
+    return [[rooms[i] for i in range(n) if piso[i] == f] for f in range(F)]
+
+
+def _piso_chico(rooms: List[str], A: List[List[int]], anchor: str):
+    """
+    Pisos de 1 o 2 salas, sin llamar al solver: con una sala el "anillo"
+    sería un lazo A[a][a] (siempre 0, infactible) aunque el piso es válido
+    y puntúa 0; con dos hay un solo orden posible (ancla, la otra),
+    puntuado como anillo e infactible si A=0 entre ellas.
+    """
+    stats = Stats()
+    a = rooms.index(anchor)
+    perm = [a] + [i for i in range(len(rooms)) if i != a]
+    if len(perm) == 1:
+        score = 0
+    elif A[perm[0]][perm[1]] == 0:
+        stats.leaves_infeasible = 1
+        return None, -10**9, stats
+    else:
+        score = evaluate_perm(perm, A)
+    stats.leaves_feasible = 1
+    return perm, score, stats
+
+
+def _es_chico(tarea) -> bool:
+    """Piso de 1 o 2 salas con un solver de anillo (acepta functools.partial)."""
+    solver, rooms = tarea[0], tarea[1]
+    return len(rooms) <= 2 and getattr(solver, "func", solver) in SOLVERS_ANILLO
+
+
+def _resolver_piso(tarea):
+    solver, rooms, A, anchor, opciones = tarea
+    if _es_chico(tarea):
+        return _piso_chico(rooms, A, anchor)
+    return solver(rooms, A, anchor_room=anchor, **opciones)
+
+
+def solve_pisos(rooms: List[str],
+                A: List[List[int]],
+                capacidades: List[int],
+                fijas: Optional[Dict[str, int]] = None,
+                anclas: Optional[Dict[int, str]] = None,
+                solver: Callable = solve_backtracking,
+                workers: Optional[int] = None,
+                **opciones):
+    """
+    Layout de varios pisos:
+      1. particionar() reparte las salas respetando capacidades y 'fijas'.
+         Por defecto el airlock (si está en rooms) queda fijo en el piso 0.
+      2. Cada piso se resuelve por separado con
+         solver(rooms_piso, A_piso, anchor_room=ancla, **opciones), los pisos en
+         paralelo en un ProcessPoolExecutor (workers=1: en este proceso).
+         Con un solver de anillo los pisos de 1 o 2 salas se puntúan directo
+         (ver _piso_chico); cualquier otro solver (p. ej. solve_piso_hex con
+         indice=...) resuelve todos los pisos.
+    Ancla de cada piso: anclas[f] si se da; si no, la sala fija en ese piso
+    (el airlock en el 0) o la primera sala del piso.
+    Devuelve (pisos, score_total, stats_total) donde pisos[f] es un dict con
+    rooms, layout (nombres en orden del solver), score y stats del piso;
+    score_total = -10**9 si algún piso quedó sin layout factible.
+    """
+    if fijas is None:
+        fijas = {AIRLOCK: 0} if AIRLOCK in rooms else {}
+    anclas = dict(anclas or {})
+    for sala, f in fijas.items():
+        anclas.setdefault(f, sala)
+
+    particion = particionar(rooms, A, capacidades, fijas)
+    idx = {r: i for i, r in enumerate(rooms)}
+    W = np.asarray(A)
+
+    tareas = []
+    for f, salas in enumerate(particion):
+        if not salas:
+            continue
+        ids = [idx[r] for r in salas]
+        ancla = anclas.get(f)
+        if ancla not in salas:
+            ancla = salas[0]
+        tareas.append((f, (solver, salas, W[np.ix_(ids, ids)].tolist(), ancla, opciones)))
+
+    grandes = [t for _, t in tareas if not _es_chico(t)]
+    if workers == 1 or len(grandes) <= 1:
+        resultados = [_resolver_piso(t) for _, t in tareas]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            resueltos = iter(pool.map(_resolver_piso, grandes))
+        resultados = [_resolver_piso(t) if _es_chico(t) else next(resueltos)
+                      for _, t in tareas]
+
+    pisos = [{"rooms": [], "layout": [], "score": 0, "stats": Stats()} for _ in capacidades]
+    stats_total = Stats()
+    score_total = 0
+    for (f, (_, salas, _, _, _)), (perm, score, stats) in zip(tareas, resultados):
+        layout = None if perm is None else [None if i is None else salas[i] for i in perm]
+        pisos[f] = {"rooms": salas, "layout": layout, "score": score, "stats": stats}
+        stats_total.merge(stats)
+        score_total = -10**9 if perm is None or score_total == -10**9 else score_total + score
+    return pisos, score_total, stats_total
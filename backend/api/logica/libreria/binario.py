@@ -0,0 +1,69 @@
+"""
+Formato binario de mallas (alternativa a las listas JSON de matriz_plana).
+
+Todo little-endian:
+    cabecera  "<4sHHHHII" (20 bytes) magic b"HMSH", versión (2), vértices por
+                         grupo (g), bytes por índice (0, 2 o 4), reservado (0),
+                         cantidad de vértices (V), cantidad de grupos (m)
+    vértices  V x 3 float32   (x, y, z) sin repetir
+    índices   m x g uint16 si V < 65536, si no uint32: vértices de cada objeto,
+              en el mismo orden que su matriz_plana() (para un hexágono: 6 de
+              la base y 6 de la tapa)
+Los vértices que comparten objetos vecinos (p. ej. hexágonos de un piso) se
+mandan una sola vez. Con g == 1 (p. ej. centros de un piso) no hay índices:
+bytes por índice = 0 y los V = m vértices van en orden, uno por grupo.
+"""
+import struct
+
+import numpy as np
+
+MEDIA_BINARIO = "application/vnd.habitat.mesh"
+MAGIC = b"HMSH"
+VERSION = 2
+CABECERA = struct.Struct("<4sHHHHII")
+
+
+def empaquetar(grupos: np.ndarray) -> bytes:
+    """(m, g, 3) vértices de m objetos de g vértices -> bytes del formato."""
+    G = np.ascontiguousarray(grupos, dtype="<f4")
+    if G.ndim == 2:
+        G = G[:, None, :]
+    m, g, _ = G.shape
+
+    if g == 1:
+        # un vértice por grupo: los índices serían 0..m-1, no se mandan
+        return CABECERA.pack(MAGIC, VERSION, 1, 0, 0, m, m) + G.tobytes()
+
+    # deduplicación exacta por bytes de cada fila (float32)
+    filas = G.reshape(-1, 3)
+    claves = filas.view(np.dtype((np.void, filas.dtype.itemsize * 3))).ravel()
+    _, primeros, indices = np.unique(claves, return_index=True, return_inverse=True)
+    # vértices en orden de primera aparición
+    orden = np.argsort(primeros, kind="stable")
+    renumerar = np.empty_like(orden)
+    renumerar[orden] = np.arange(len(orden))
+    vertices = filas[primeros[orden]]
+    ancho = 2 if len(vertices) < 1 << 16 else 4
+    indices = renumerar[indices.ravel()].astype(f"<u{ancho}")
+
+    return b"".join([CABECERA.pack(MAGIC, VERSION, g, ancho, 0, len(vertices), m),
+                     vertices.tobytes(), indices.tobytes()])
+
+
+def desempaquetar(datos: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """
+    bytes del formato -> (vertices (V, 3) float32, indices (m, g) uint16/uint32).
+    Sin índices en los datos (g == 1) devuelve indices = arange(m) como (m, 1).
+    """
+    magic, version, g, ancho, _, V, m = CABECERA.unpack_from(datos)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"No es una malla HMSH v{VERSION}")
+    inicio = CABECERA.size
+    vertices = np.frombuffer(datos, dtype="<f4", count=V * 3, offset=inicio).reshape(V, 3)
+    if ancho == 0:
+        return vertices, np.arange(m, dtype="<u4").reshape(m, 1)
+    if ancho not in (2, 4):
+        raise ValueError(f"Ancho de índice inválido: {ancho}")
+    indices = np.frombuffer(datos, dtype=f"<u{ancho}", count=m * g,
+                            offset=inicio + V * 12).reshape(m, g)
+    return vertices, indices
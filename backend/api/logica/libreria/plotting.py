@@ -41,9 +41,7 @@ def dibujar_interactivo(objeto):
         elif event.key == "e":
             objeto.rotar_y(-5)
 
-        pts = [(v.x, v.y) for v in objeto.vertices]
-        xs, ys = zip(*pts)
-        sc.set_offsets(list(zip(xs, ys)))
+        sc.set_offsets(objeto.coordenadas[:, :2])
         fig.canvas.draw_idle()
 
     fig.canvas.mpl_connect("key_press_event", on_key)
@@ -0,0 +1,193 @@
+from typing import Iterable, Optional, Self, Sequence, Union
+
+import numpy as np
+
+from logica.objetos.objeto import Objeto
+
+Seleccion = Union[None, int, Sequence[int], np.ndarray]
+
+
+class Escena:
+    """
+    Varios Objeto guardados juntos para transformarlos en bloque.
+    - vertices: un único arreglo (N, 3) float64 con los vértices de todos los
+      objetos, uno detrás del otro.
+    - offsets: (k+1,) el objeto i ocupa vertices[offsets[i]:offsets[i+1]].
+    - ids: (k,) id de cada Objeto de origen.
+    Cada transformación se aplica a una selección de objetos (índices, máscara
+    booleana o None = todos) con una sola operación vectorizada, y devuelve las
+    cajas (min, max) de los objetos afectados.
+    """
+
+    def __init__(self, objetos: Iterable[Objeto] = ()) -> None:
+        objetos = list(objetos)
+        bloques = [o.coordenadas for o in objetos]
+        tamaños = [len(b) for b in bloques]
+
+        self.ids = np.array([o.id for o in objetos], dtype=np.int64)
+        self.offsets = np.concatenate([[0], np.cumsum(tamaños, dtype=np.intp)])
+        self.vertices = (np.concatenate(bloques) if bloques
+                         else np.empty((0, 3), dtype=np.float64))
+        # objeto al que pertenece cada vértice
+        self._dueño = np.repeat(np.arange(len(objetos)), tamaños)
+
+    @classmethod
+    def desde_bloques(cls, bloques: np.ndarray, ids: Optional[np.ndarray] = None) -> Self:
+        """
+        Escena de k objetos de g vértices a partir de un arreglo (k, g, 3), sin
+        crear un Objeto por entrada. ids por defecto: 0..k-1.
+        """
+        B = np.asarray(bloques, dtype=np.float64)
+        if B.ndim != 3 or B.shape[2] != 3:
+            raise ValueError(f"Se esperaba un arreglo (k, g, 3), no {B.shape}")
+        k, g, _ = B.shape
+
+        escena = cls()
+        escena.ids = np.arange(k, dtype=np.int64) if ids is None else np.asarray(ids, dtype=np.int64)
+        escena.offsets = np.arange(k + 1, dtype=np.intp) * g
+        escena.vertices = B.reshape(-1, 3).copy()
+        escena._dueño = np.repeat(np.arange(k), g)
+        return escena
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # ---------- selección ----------
+
+    def _indices(self, seleccion: Seleccion) -> np.ndarray:
+        """
+        Índices de objeto sin repetir (en el orden de su primera aparición).
+        Ids fuera de [0, len) o una máscara de otro largo: ValueError.
+        """
+        if seleccion is None:
+            return np.arange(len(self))
+        sel = np.asarray(seleccion)
+        if sel.dtype == bool:
+            if sel.shape != (len(self),):
+                raise ValueError(f"Máscara de largo {sel.size}, se esperaba {len(self)}")
+            return np.flatnonzero(sel)
+        sel = np.atleast_1d(sel).reshape(-1).astype(np.intp)
+        if len(sel) and (sel.min() < 0 or sel.max() >= len(self)):
+            raise ValueError(f"Índices fuera de rango para {len(self)} objetos")
+        _, primeros = np.unique(sel, return_index=True)
+        return sel[np.sort(primeros)]
+
+    def _mascara(self, indices: np.ndarray) -> np.ndarray:
+        """Máscara (N,) de los vértices que pertenecen a 'indices'."""
+        marcados = np.zeros(len(self), dtype=bool)
+        marcados[indices] = True
+        return marcados[self._dueño]
+
+    # ---------- consultas ----------
+
+    def coordenadas(self, i: int) -> np.ndarray:
+        """Vértices del objeto i (vista sobre el arreglo compartido)."""
+        return self.vertices[self.offsets[i]:self.offsets[i + 1]]
+
+    def cajas(self, seleccion: Seleccion = None) -> np.ndarray:
+        """(k, 2, 3): [min, max] de cada objeto seleccionado."""
+        indices = self._indices(seleccion)
+        # reduceat sobre todos los objetos no vacíos (un vacío partiría mal los tramos)
+        cajas = np.full((len(self), 2, 3), np.nan)
+        no_vacios = np.flatnonzero(np.diff(self.offsets) > 0)
+        if len(no_vacios):
+            inicios = self.offsets[no_vacios]
+            cajas[no_vacios, 0] = np.minimum.reduceat(self.vertices, inicios)
+            cajas[no_vacios, 1] = np.maximum.reduceat(self.vertices, inicios)
+        return cajas[indices]
+
+    def centros(self, seleccion: Seleccion = None) -> np.ndarray:
+        """(k, 3): centro de la caja de cada objeto seleccionado."""
+        return self.cajas(seleccion).mean(axis=1)
+
+    # ---------- transformaciones ----------
+
+    def transformar(self,
+                    matriz: list[list[int | float]],
+                    seleccion: Seleccion = None,
+                    pivote: Optional[str] = None) -> np.ndarray:
+        """
+        Aplica 'matriz' (3x3 lineal o 4x4 afín) a los objetos seleccionados.
+        pivote=None transforma respecto al origen; pivote="centro" respecto al
+        centro de la caja de cada objeto (p. ej. girar cada módulo en su lugar).
+        Devuelve las cajas (k, 2, 3) de los objetos seleccionados.
+        """
+        M = np.asarray(matriz, dtype=np.float64)
+        if M.shape == (3, 3):
+            M4 = np.eye(4)
+            M4[:3, :3] = M
+            M = M4
+        elif M.shape != (4, 4):
+            raise ValueError(f"Se esperaba una matriz 3x3 o 4x4, no {M.shape}")
+
+        indices = self._indices(seleccion)
+        todos = len(indices) == len(self)
+        V = self.vertices if todos else self.vertices[self._mascara(indices)]
+
+        if pivote is None:
+            V = V @ M[:3, :3].T + M[:3, 3]
+        elif pivote == "centro":
+            centros = np.zeros((len(self), 3))
+            centros[indices] = self.centros(indices)
+            dueño = self._dueño if todos else self._dueño[self._mascara(indices)]
+            c = centros[dueño]
+            V = (V - c) @ M[:3, :3].T + M[:3, 3] + c
+        else:
+            raise ValueError(f"Pivote no soportado: {pivote}")
+
+        if todos:
+            self.vertices = V
+        else:
+            self.vertices[self._mascara(indices)] = V
+        return self.cajas(indices)
+
+    def escalar(self, fx: float, fy: float, fz: float,
+                seleccion: Seleccion = None, pivote: Optional[str] = None) -> np.ndarray:
+        return self.transformar([[fx, 0, 0], [0, fy, 0], [0, 0, fz]], seleccion, pivote)
+
+    def trasladar(self, dx: float, dy: float, dz: float,
+                  seleccion: Seleccion = None) -> np.ndarray:
+        matriz = [[1, 0, 0, dx], [0, 1, 0, dy], [0, 0, 1, dz], [0, 0, 0, 1]]
+        return self.transformar(matriz, seleccion)
+
+    def rotar_z(self, g_z: int | float,
+                seleccion: Seleccion = None, pivote: Optional[str] = None) -> np.ndarray:
+        t = np.radians(g_z)
+        matriz = [[np.cos(t), -np.sin(t), 0], [np.sin(t), np.cos(t), 0], [0, 0, 1]]
+        return self.transformar(matriz, seleccion, pivote)
+
+    def rotar_x(self, g_x: int | float,
+                seleccion: Seleccion = None, pivote: Optional[str] = None) -> np.ndarray:
+        t = np.radians(g_x)
+        matriz = [[1, 0, 0], [0, np.cos(t), -np.sin(t)], [0, np.sin(t), np.cos(t)]]
+        return self.transformar(matriz, seleccion, pivote)
+
+    def rotar_y(self, g_y: int | float,
+                seleccion: Seleccion = None, pivote: Optional[str] = None) -> np.ndarray:
+        t = np.radians(g_y)
+        matriz = [[np.cos(t), 0, np.sin(t)], [0, 1, 0], [-np.sin(t), 0, np.cos(t)]]
+        return self.transformar(matriz, seleccion, pivote)
+
+    # ---------- salida ----------
+
+    def objetos(self) -> list[Objeto]:
+        """Un Objeto por entrada (con su id original) con la geometría actual."""
+        salida = []
+        for i, id_ in enumerate(self.ids.tolist()):
+            o = Objeto().set_coordenadas(self.coordenadas(i))
+            o.id = id_
+            salida.append(o)
+        return salida
+
+    def matrices_planas(self) -> list[list[list[float]]]:
+        """Lo mismo que [o.matriz_plana() for o in objetos] sin crear Objeto."""
+        return [b.tolist() for b in np.split(self.vertices, self.offsets[1:-1])]
+
+    def agregar(self, objeto: Objeto) -> Self:
+        """Agrega un objeto al final (copia el arreglo; para muchos usar el constructor)."""
+        V = objeto.coordenadas
+        self.vertices = np.concatenate([self.vertices, V])
+        self.offsets = np.append(self.offsets, self.offsets[-1] + len(V))
+        self._dueño = np.concatenate([self._dueño, np.full(len(V), len(self.ids), dtype=np.intp)])
+        self.ids = np.append(self.ids, objeto.id)
+        return self
@@ -1,14 +1,18 @@
 import math
+from functools import lru_cache
 from typing import Sequence, Union
 import numpy as np
 
+from logica.objetos.escena import Escena
+from logica.objetos.indice_hex import IndiceHex
+from logica.objetos.malla_hex import (MallaHex, axial_a_cartesiano, axiales, celdas_en_anillos,
+                                     malla_hex)
 from logica.objetos.objeto import Objeto
 from logica.objetos.punto import Punto
-from logica.libreria.algebra import punto_medio
 
 # ---- Helper para construir Punto con tu firma real ----
 def make_punto(x: float, y: float, z: float) -> Punto:
-    return Punto([[float(x)], [float(y)], [float(z)]])
+    return Punto.desde_tupla((float(x), float(y), float(z)))
 
 # ---- Normalizador de "centro" (acepta Punto, lista o np.array) ----
 def _to_punto(centro: Union[Punto, Sequence[float], np.ndarray]) -> Punto:
@@ -33,43 +37,73 @@ def f_x(x, radio, lado):
 def f_y(y, radio, lado):
     return y + radio * math.sin(2 * math.pi * lado / 6)
 
+@lru_cache(maxsize=64)
+def plantilla_hexagono(radio: float) -> np.ndarray:
+    """(6, 2) esquinas del hexágono de 'radio' centrado en el origen (solo lectura)."""
+    esquinas = np.array([(f_x(0.0, radio, i), f_y(0.0, radio, i)) for i in range(6)])
+    esquinas.setflags(write=False)
+    return esquinas
+
 def hexagono(centro: Union[Punto, Sequence[float], np.ndarray], radio: float) -> Objeto:
     centro = _to_punto(centro)
     o = Objeto()
 
-    # Base (z=0)
-    for i in range(6):
-        x = f_x(centro.x, radio, i)
-        y = f_y(centro.y, radio, i)
-        o.add_vertice(make_punto(x, y, 0.0))
-
-    # Tapa (z=centro.z)
-    for i in range(6):
-        x = f_x(centro.x, radio, i)
-        y = f_y(centro.y, radio, i)
-        o.add_vertice(make_punto(x, y, centro.z))
+    # Base (z=0) y tapa (z=centro.z): la plantilla trasladada al centro
+    V = np.empty((12, 3))
+    V[:6, :2] = V[6:, :2] = plantilla_hexagono(float(radio)) + (centro.x, centro.y)
+    V[:6, 2] = 0.0
+    V[6:, 2] = centro.z
+    o.add_vertices(V)
 
     return o
 
+@lru_cache(maxsize=32)
+def geometria_piso(radio: float, espesor: float, anillos: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (centros (m, 3), hexágonos (m, 12, 3)) de Piso(radio, espesor, anillos),
+    calculados una vez por combinación de parámetros (arreglos de solo lectura).
+    """
+    centros = np.zeros((celdas_en_anillos(anillos), 3))
+    centros[:, :2] = axial_a_cartesiano(axiales(anillos), radio)
+
+    # mismo resultado que hexagono(c, radio) para cada centro (tapa en z = c.z = 0)
+    H = np.zeros((len(centros), 12, 3))
+    H[:, :6, :2] = H[:, 6:, :2] = plantilla_hexagono(radio) + centros[:, None, :2]
+    H[:, 6:, 2] = centros[:, None, 2]
+
+    centros.setflags(write=False)
+    H.setflags(write=False)
+    return centros, H
+
 class Piso:
-    def __init__(self, radio: float, espesor: float):
+    """
+    Piso hexagonal de 'anillos' anillos alrededor de la celda central
+    (anillos=1: la central y sus 6 vecinas). Los centros salen de
+    malla_hex.axiales en orden: centro y luego anillo por anillo.
+    """
+
+    def __init__(self, radio: float, espesor: float, anillos: int = 1):
         self.radio = float(radio)
-        self.centros: list[Punto] = []
+        self.espesor = float(espesor)
+        self.anillos = anillos
 
-        # ✅ Guarda Punto (no vector_plano)
-        self.centros.append(make_punto(0.0, 0.0, 0.0))
-        self.central = hexagono(make_punto(0.0, 0.0, float(espesor)), self.radio)
+        self.central = hexagono(make_punto(0.0, 0.0, self.espesor), self.radio)
 
-        # Toma 6 vértices de la base
-        verts = self.central.vertices
-        base_verts = verts[:6] if len(verts) >= 6 else verts
+        self.axiales = axiales(anillos)
+        centros, _ = geometria_piso(self.radio, self.espesor, anillos)
+        self.centros: list[Punto] = Punto.desde_array(centros)
 
-        # 6 centros vecinos (tu misma lógica 2*medio)
-        for i in range(6):
-            v1 = base_verts[i]
-            v2 = base_verts[(i + 1) % 6]
-            mx, my = punto_medio(v1, v2)  # escalares
-            self.centros.append(make_punto(2.0 * mx, 2.0 * my, 0.0))
+    def malla(self) -> MallaHex:
+        """Centros y vértices compartidos del piso en arreglos."""
+        return malla_hex(self.anillos, self.radio)
+
+    def indice(self) -> IndiceHex:
+        """Vecinos y búsqueda punto -> celda sobre las celdas del piso."""
+        return IndiceHex(self.axiales, self.radio)
 
     def hexagonos(self):
-        return [hexagono(c, self.radio).matriz_plana() for c in self.centros]
+        return geometria_piso(self.radio, self.espesor, self.anillos)[1].tolist()
+
+    def escena(self) -> Escena:
+        """Los hexágonos del piso en una Escena para transformarlos en bloque."""
+        return Escena(hexagono(c, self.radio) for c in self.centros)
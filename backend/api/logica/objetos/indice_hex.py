@@ -0,0 +1,125 @@
+"""
+Índice espacial sobre un piso hexagonal en coordenadas axiales.
+
+Las celdas se guardan en una grilla densa (q, r) -> índice (-1 = no hay
+celda), así vecinos, punto -> celda y anillos/rangos son O(1) por celda y se
+pueden consultar en bloque con arreglos.
+"""
+from typing import Optional, Union
+
+import numpy as np
+
+from logica.objetos.malla_hex import DIRECCIONES, MallaHex, axiales
+
+Celda = Union[int, tuple[int, int]]
+
+
+class IndiceHex:
+    """
+    axiales: (m, 2) coordenadas de las celdas (el índice de cada celda es su
+    fila). radio: circunradio de cada hexágono (para pasar de x, y a celda).
+    """
+
+    def __init__(self, axiales: np.ndarray, radio: float = 1.0) -> None:
+        self.axiales = np.asarray(axiales, dtype=np.int64).reshape(-1, 2)
+        self.radio = float(radio)
+
+        self._min = self.axiales.min(axis=0) if len(self.axiales) else np.zeros(2, dtype=np.int64)
+        forma = (self.axiales.max(axis=0) - self._min + 1) if len(self.axiales) else (0, 0)
+        self._grilla = np.full(tuple(forma), -1, dtype=np.int64)
+        q, r = (self.axiales - self._min).T
+        self._grilla[q, r] = np.arange(len(self.axiales))
+
+        # (m, 6) vecino en cada dirección de DIRECCIONES, -1 si cae fuera
+        self.vecinos_array = self.buscar(self.axiales[:, None, :] + DIRECCIONES)
+
+    @classmethod
+    def desde_malla(cls, malla: MallaHex) -> "IndiceHex":
+        return cls(malla.axiales, malla.radio)
+
+    def __len__(self) -> int:
+        return len(self.axiales)
+
+    def __contains__(self, qr) -> bool:
+        return self.buscar(np.asarray(qr)) >= 0
+
+    # ---------- coordenadas -> celda ----------
+
+    def buscar(self, qr: np.ndarray) -> np.ndarray:
+        """Índices de celda para un arreglo (..., 2) de axiales (-1 si no existe)."""
+        qr = np.asarray(qr, dtype=np.int64) - self._min
+        q, r = qr[..., 0], qr[..., 1]
+        dentro = (q >= 0) & (r >= 0) & (q < self._grilla.shape[0]) & (r < self._grilla.shape[1])
+        salida = np.full(q.shape, -1, dtype=np.int64)
+        salida[dentro] = self._grilla[q[dentro], r[dentro]]
+        return salida
+
+    def indice(self, celda: Celda) -> Optional[int]:
+        """Índice de una celda dada por índice o por (q, r); None si no existe."""
+        if isinstance(celda, (int, np.integer)):
+            return int(celda) if 0 <= celda < len(self) else None
+        i = int(self.buscar(np.asarray(celda)))
+        return i if i >= 0 else None
+
+    def axiales_desde_xy(self, xy: np.ndarray) -> np.ndarray:
+        """(..., 2) puntos (x, y) -> (..., 2) axiales de la celda que los contiene."""
+        xy = np.asarray(xy, dtype=np.float64)
+        x, y = xy[..., 0] / self.radio, xy[..., 1] / self.radio
+        fq = 2 / 3 * x
+        fr = -1 / 3 * x + np.sqrt(3) / 3 * y
+        fs = -fq - fr
+
+        # redondeo cúbico: se corrige la coordenada con mayor error
+        q, r, s = np.rint(fq), np.rint(fr), np.rint(fs)
+        dq, dr, ds = np.abs(q - fq), np.abs(r - fr), np.abs(s - fs)
+        q = np.where((dq > dr) & (dq > ds), -r - s, q)
+        r = np.where(~((dq > dr) & (dq > ds)) & (dr > ds), -q - s, r)
+        return np.stack([q, r], axis=-1).astype(np.int64)
+
+    def celda_en(self, x: float, y: float) -> Optional[int]:
+        """Celda que contiene el punto (x, y), o None si cae fuera del piso."""
+        i = int(self.buscar(self.axiales_desde_xy(np.array([x, y]))))
+        return i if i >= 0 else None
+
+    # ---------- topología ----------
+
+    def vecinos(self, celda: Celda) -> list[int]:
+        """Celdas adyacentes (comparten un lado) que existen en el piso."""
+        i = self.indice(celda)
+        if i is None:
+            return []
+        fila = self.vecinos_array[i]
+        return fila[fila >= 0].tolist()
+
+    def adyacencias(self) -> np.ndarray:
+        """(E, 2) pares (i, j) con i < j de celdas que comparten un lado."""
+        i = np.repeat(np.arange(len(self)), 6)
+        j = self.vecinos_array.ravel()
+        validos = j > i
+        return np.column_stack([i[validos], j[validos]])
+
+    def distancia(self, a: Celda, b: Celda) -> int:
+        """Distancia hexagonal (en pasos de celda) entre dos celdas."""
+        qa, ra = self._qr(a)
+        qb, rb = self._qr(b)
+        dq, dr = qa - qb, ra - rb
+        return (abs(dq) + abs(dr) + abs(dq + dr)) // 2
+
+    def anillo(self, celda: Celda, k: int) -> list[int]:
+        """Celdas existentes a distancia exactamente k (orden de axiales())."""
+        return self._alrededor(celda, axiales(k, desde=k))
+
+    def rango(self, celda: Celda, k: int) -> list[int]:
+        """Celdas existentes a distancia <= k, incluida la propia."""
+        return self._alrededor(celda, axiales(k))
+
+    def _alrededor(self, celda: Celda, desplazamientos: np.ndarray) -> list[int]:
+        indices = self.buscar(np.asarray(self._qr(celda)) + desplazamientos)
+        return indices[indices >= 0].tolist()
+
+    def _qr(self, celda: Celda) -> tuple[int, int]:
+        if isinstance(celda, (int, np.integer)):
+            q, r = self.axiales[celda].tolist()
+            return q, r
+        q, r = celda
+        return int(q), int(r)
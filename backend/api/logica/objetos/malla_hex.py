@@ -0,0 +1,120 @@
+"""
+Grillas hexagonales de k anillos en coordenadas axiales (q, r).
+
+Misma orientación que hexagono(): hexágono "flat-top" con el vértice 0 en
+ángulo 0°, y vecinos pegados lado a lado a distancia √3·radio (ángulos 30°,
+90°, ...). Un piso de k anillos tiene 3k² + 3k + 1 celdas y 6(k+1)² vértices
+distintos.
+"""
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import numpy as np
+
+from logica.objetos.objeto import Objeto
+
+# Vecinos axiales en orden antihorario, empezando en 30°
+DIRECCIONES = np.array([(1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1)], dtype=np.int64)
+
+# Vértice c de la celda (q, r) en la red entera (x en radio/2, y en radio·√3/2):
+#   (3q + DX[c], 2r + q + DY[c]); vértices compartidos tienen la misma clave
+DX = np.array([2, 1, -1, -2, -1, 1], dtype=np.int64)
+DY = np.array([0, 1, 1, 0, -1, -1], dtype=np.int64)
+
+
+def celdas_en_anillos(anillos: int) -> int:
+    return 3 * anillos * anillos + 3 * anillos + 1
+
+
+def axiales(anillos: int, desde: int = 0) -> np.ndarray:
+    """
+    (m, 2) coordenadas axiales de los anillos desde..anillos, en orden: centro,
+    y cada anillo k arrancando en k·DIRECCIONES[0] y recorriendo sus 6 lados.
+    """
+    if desde == 0:
+        centro = np.zeros((1, 2), dtype=np.int64)
+        desde = 1
+    else:
+        centro = np.empty((0, 2), dtype=np.int64)
+
+    ks = np.arange(desde, anillos + 1)
+    if len(ks) == 0:
+        return centro
+    tamaños = 6 * ks
+    k = np.repeat(ks, tamaños)
+    inicio_anillo = np.repeat(np.cumsum(tamaños) - tamaños, tamaños)
+    t = np.arange(len(k)) - inicio_anillo
+    lado, paso = t // k, t % k
+
+    # lado i: parte en k·dir[i] y avanza 'paso' veces en dir[i+2]
+    qr = k[:, None] * DIRECCIONES[lado] + paso[:, None] * DIRECCIONES[(lado + 2) % 6]
+    return np.vstack([centro, qr])
+
+
+def axial_a_cartesiano(qr: np.ndarray, radio: float) -> np.ndarray:
+    """(m, 2) axiales -> (m, 2) centros (x, y)."""
+    q, r = qr[:, 0], qr[:, 1]
+    return np.column_stack([1.5 * radio * q, np.sqrt(3) * radio * (r + q / 2)])
+
+
+def esquinas(qr: np.ndarray, radio: float) -> np.ndarray:
+    """(m, 6, 2) esquinas (x, y) de cada celda, en el orden de hexagono()."""
+    X = 3 * qr[:, :1] + DX
+    Y = 2 * qr[:, 1:] + qr[:, :1] + DY
+    return np.stack([X * (radio / 2), Y * (radio * np.sqrt(3) / 2)], axis=-1)
+
+
+@dataclass
+class MallaHex:
+    """
+    axiales: (m, 2) int64 | centros: (m, 3) con z = 0
+    vertices: (v, 3) vértices únicos de la base (z = 0)
+    celdas: (m, 6) índices en 'vertices' de las esquinas de cada celda
+    """
+    radio: float
+    anillos: int
+    axiales: np.ndarray
+    centros: np.ndarray
+    vertices: np.ndarray
+    celdas: np.ndarray
+
+
+def malla_hex(anillos: int, radio: float) -> MallaHex:
+    """Piso de 'anillos' anillos con centros y vértices compartidos, en bloque."""
+    qr = axiales(anillos)
+    m = len(qr)
+    centros = np.zeros((m, 3))
+    centros[:, :2] = axial_a_cartesiano(qr, radio)
+
+    # claves enteras de la red: vértices compartidos entre celdas coinciden exacto
+    X = 3 * qr[:, :1] + DX
+    Y = 2 * qr[:, 1:] + qr[:, :1] + DY
+    y0, alto = Y.min(), Y.max() - Y.min() + 1
+    claves, celdas = np.unique(X * alto + (Y - y0), return_inverse=True)
+    vertices = np.zeros((len(claves), 3))
+    X, Y = np.divmod(claves, alto)
+    vertices[:, 0] = X * (radio / 2)
+    vertices[:, 1] = (Y + y0) * (radio * np.sqrt(3) / 2)
+
+    return MallaHex(radio, anillos, qr, centros, vertices, celdas.reshape(m, 6))
+
+
+def iter_celdas(radio: float,
+                anillos: Optional[int] = None,
+                altura: float = 0.0) -> Iterator[tuple[int, int, Objeto]]:
+    """
+    Recorre el piso anillo por anillo sin armarlo entero (anillos=None: sin
+    fin). Cada anillo se calcula en bloque; entrega (q, r, hexágono) con los
+    12 vértices de hexagono(): base en z = 0 y tapa en z = altura.
+    """
+    k = 0
+    while anillos is None or k <= anillos:
+        qr = axiales(k, desde=k)
+        base = np.zeros((len(qr), 6, 3))
+        base[:, :, :2] = esquinas(qr, radio)
+        tapa = base.copy()
+        tapa[:, :, 2] = altura
+        bloques = np.concatenate([base, tapa], axis=1)
+        for (q, r), V in zip(qr.tolist(), bloques):
+            yield q, r, Objeto().set_coordenadas(V)
+        k += 1
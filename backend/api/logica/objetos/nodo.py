@@ -52,24 +52,24 @@ def matriz_adyacencia(rooms: List[Nodo],
       - 0 para pares prohibidos (zero_pairs)
       - pesos personalizados en 'prefs'
     """
-    # n = len(rooms)
-    # idx = {r: i for i, r in enumerate(rooms)}
-    # A = [[default_weight for _ in range(n)] for __ in range(n)]
-    # for i in range(n):
-    #     A[i][i] = 0  # no nos interesa i~i
-
-    # # pares prohibidos
-    # for pair in zero_pairs:
-    #     ia, ib = idx[pair[0]], idx[pair[1]]
-    #     A[ia][ib] = 0
-    #     A[ib][ia] = 0
-
-    # for p in prefs:
-    #     pair = p["pair"]  # type: ignore
-    #     w = p["weight"]  # type: ignore
-
-    #     ia, ib = idx[pair[0]], idx[pair[1]]
-    #     A[ia][ib] = w
-    #     A[ib][ia] = w
-
-    # return A, idx
+    n = len(rooms)
+    idx = {r: i for i, r in enumerate(rooms)}
+    A = [[default_weight for _ in range(n)] for __ in range(n)]
+    for i in range(n):
+        A[i][i] = 0  # no nos interesa i~i
+
+    # pares prohibidos
+    for pair in zero_pairs:
+        ia, ib = idx[pair[0]], idx[pair[1]]
+        A[ia][ib] = 0
+        A[ib][ia] = 0
+
+    for p in prefs:
+        pair = p["pair"]  # type: ignore
+        w = p["weight"]  # type: ignore
+
+        ia, ib = idx[pair[0]], idx[pair[1]]
+        A[ia][ib] = w
+        A[ib][ia] = w
+
+    return A, idx
@@ -1,46 +1,184 @@
 from random import randint
 from typing import Self
 
-from matplotlib.pylab import cos, radians, sin
+import numpy as np
 
-from logica.libreria.algebra_matrices import producto_punto
 from logica.objetos.punto import Punto
 
 
+class _VerticeFijo(Punto):
+    """
+    Punto entregado por Objeto.vertices: es una copia, así que asignarle x/y/z
+    no cambiaría el Objeto; en lugar de ignorarlo en silencio, falla.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def desde_fila(cls, fila) -> "_VerticeFijo":
+        p = cls.__new__(cls)
+        for nombre, valor in zip(Punto.__slots__, fila):
+            object.__setattr__(p, nombre, valor)
+        return p
+
+    def __setattr__(self, nombre, valor) -> None:
+        raise AttributeError("Objeto.vertices es de solo lectura: usar set_vertices / add_vertice")
+
+
 class Objeto:
+    """
+    Cuerpo rígido definido por sus vértices.
+    - La geometría original vive en un arreglo contiguo (n, 3) float64.
+    - rotar_*/escalar/trasladar/transformar no tocan los vértices: componen
+      una matriz afín 4x4 pendiente. Los vértices se materializan (un solo
+      V @ Mᵀ) recién al leerlos (coordenadas, vertices, matriz_plana,
+      dimensiones) y se guardan hasta la próxima transformación.
+    - Como siempre se parte de la geometría original no se acumula error
+      numérico entre rotaciones; resetear() vuelve a ella.
+    - add_vertice / add_vertices son O(1) amortizado por vértice: la caja
+      [min, max] (de donde salen largo/ancho/alto) se actualiza incremental.
+    'vertices' sigue entregando Punto para quien los lea uno a uno, pero es
+    una copia de solo lectura (tupla de _VerticeFijo): para editar la
+    geometría usar set_vertices / add_vertice / add_vertices.
+    """
+
     def __init__(self) -> None:
         self.id = randint(100000, 999999)
 
-        self.largo = None
-        self.ancho = None
-        self.alto = None
+        # geometría original: las primeras _n filas de un buffer que crece
+        # al doble, así agregar vértices de a uno es O(1) amortizado
+        self._buffer = np.empty((8, 3), dtype=np.float64)
+        self._n = 0
+        self._transformacion = np.eye(4)
+        self._identidad = True
+        self._coordenadas = self._buffer[:0]
+        self._sucio = False
+        # [min, max] de las coordenadas actuales (None = hay que recalcular)
+        self._caja: np.ndarray | None = None
+        # largo/ancho/alto son None hasta la primera edición de vértices
+        # (como cuando eran atributos que fijaba actualizar_dimensiones)
+        self._medido = False
 
-        self.vertices: list[Punto] = []
+    # ---------- materialización ----------
 
-    def actualizar_dimensiones(self) -> Self:
-        if len(self.vertices) < 2:
-            self.largo = self.ancho = self.alto = 0
-            return self
+    @property
+    def _original(self) -> np.ndarray:
+        return self._buffer[:self._n]
+
+    def _materializar(self) -> np.ndarray:
+        if self._identidad:
+            return self._original
+        if self._sucio:
+            T = self._transformacion
+            self._coordenadas = self._original @ T[:3, :3].T + T[:3, 3]
+            self._sucio = False
+            self._caja = None
+        return self._coordenadas
+
+    def _hornear(self) -> None:
+        """La geometría transformada pasa a ser la original (identidad pendiente)."""
+        if self._identidad:
+            return
+        self._reemplazar(self._materializar())
 
-        xs = [v.x for v in self.vertices]
-        ys = [v.y for v in self.vertices]
-        zs = [v.z for v in self.vertices]
+    def _reemplazar(self, V: np.ndarray) -> None:
+        self._buffer = np.array(V, dtype=np.float64).reshape(-1, 3)
+        self._n = len(self._buffer)
+        self._transformacion = np.eye(4)
+        self._identidad = True
+        self._caja = None
+        self._medido = True
 
-        self.largo = max(xs) - min(xs)
-        self.ancho = max(ys) - min(ys)
-        self.alto = max(zs) - min(zs)
+    def _reservar(self, extra: int) -> None:
+        if self._n + extra > len(self._buffer):
+            nuevo = np.empty((max(2 * len(self._buffer), self._n + extra, 8), 3))
+            nuevo[:self._n] = self._original
+            self._buffer = nuevo
 
+    @property
+    def coordenadas(self) -> np.ndarray:
+        """Vértices transformados como arreglo (n, 3) de solo lectura."""
+        vista = self._materializar().view()
+        vista.flags.writeable = False
+        return vista
+
+    @property
+    def transformacion(self) -> np.ndarray:
+        """Matriz afín 4x4 acumulada desde la geometría original (copia)."""
+        return self._transformacion.copy()
+
+    @property
+    def vertices(self) -> tuple[Punto, ...]:
+        """Vértices actuales como Punto (copias: modificarlos levanta AttributeError)."""
+        return tuple(_VerticeFijo.desde_fila(f) for f in self._materializar().tolist())
+
+    @vertices.setter
+    def vertices(self, vertices: list[Punto]) -> None:
+        self.set_vertices(vertices)
+
+    @property
+    def caja(self) -> np.ndarray:
+        """(2, 3) [min, max] de los vértices actuales (NaN si no hay vértices)."""
+        V = self._materializar()
+        if len(V) == 0:
+            return np.full((2, 3), np.nan)
+        if self._caja is None:
+            self._caja = np.stack([V.min(axis=0), V.max(axis=0)])
+        return self._caja.copy()
+
+    @property
+    def largo(self) -> float:
+        return self._dimensiones()[0]
+
+    @property
+    def ancho(self) -> float:
+        return self._dimensiones()[1]
+
+    @property
+    def alto(self) -> float:
+        return self._dimensiones()[2]
+
+    def _dimensiones(self) -> tuple:
+        if not self._medido:
+            return (None, None, None)
+        if self._n < 2:
+            return (0, 0, 0)
+        mn, mx = self.caja
+        return tuple((mx - mn).tolist())
+
+    def actualizar_dimensiones(self) -> Self:
+        # Las dimensiones salen de la caja, que se mantiene sola; se conserva
+        # para quien la llamaba después de editar vértices.
+        self._caja = None
+        self._medido = True
         return self
 
+    # ---------- transformaciones ----------
+
     def transformar(self, matriz: list[list[int | float]]):
-        nuevos_vertices = []
-        for v in self.matriz_anidada():
-            v_rotado = producto_punto(matriz, v)
-            nuevos_vertices.append(Punto(v_rotado))
+        """Compone 'matriz' (3x3 lineal o 4x4 afín) sobre la transformación pendiente."""
+        M = np.asarray(matriz, dtype=np.float64)
+        if M.shape == (3, 3):
+            M4 = np.eye(4)
+            M4[:3, :3] = M
+            M = M4
+        elif M.shape != (4, 4):
+            raise ValueError(f"Se esperaba una matriz 3x3 o 4x4, no {M.shape}")
+
+        self._transformacion = M @ self._transformacion
+        self._identidad = False
+        self._medido = True
+        self._sucio = True
 
-        self.vertices = nuevos_vertices
+        return self
 
-        return self.actualizar_dimensiones()
+    def resetear(self) -> Self:
+        """Descarta todas las transformaciones y vuelve a la geometría original."""
+        self._transformacion = np.eye(4)
+        self._identidad = True
+        self._caja = None
+
+        return self
 
     def escalar(self, fx: float, fy: float, fz: float) -> Self:
         matriz = [
@@ -51,54 +189,97 @@ class Objeto:
 
         return self.transformar(matriz)
 
+    def trasladar(self, dx: float, dy: float, dz: float) -> Self:
+        matriz = [
+            [1, 0, 0, dx],
+            [0, 1, 0, dy],
+            [0, 0, 1, dz],
+            [0, 0, 0, 1]
+        ]
+
+        return self.transformar(matriz)
+
     def rotar_z(self, g_z: int | float) -> Self:
-        theta = radians(g_z)
+        theta = np.radians(g_z)
         matriz = [
-            [cos(theta), -sin(theta), 0],
-            [sin(theta),  cos(theta), 0],
+            [np.cos(theta), -np.sin(theta), 0],
+            [np.sin(theta),  np.cos(theta), 0],
             [0,         0,        1]
         ]
 
         return self.transformar(matriz)
 
     def rotar_x(self, g_x: int | float) -> Self:
-        theta = radians(g_x)
+        theta = np.radians(g_x)
         matriz = [
             [1, 0, 0],
-            [0, cos(theta), -sin(theta)],
-            [0, sin(theta),  cos(theta)]
+            [0, np.cos(theta), -np.sin(theta)],
+            [0, np.sin(theta),  np.cos(theta)]
         ]
 
         return self.transformar(matriz)
 
     def rotar_y(self, g_y: int | float) -> Self:
-        theta = radians(g_y)
+        theta = np.radians(g_y)
         matriz = [
-            [cos(theta), 0, sin(theta)],
+            [np.cos(theta), 0, np.sin(theta)],
             [0, 1, 0],
-            [-sin(theta), 0,  cos(theta)]
+            [-np.sin(theta), 0,  np.cos(theta)]
         ]
 
         return self.transformar(matriz)
 
+    # ---------- edición de vértices ----------
+
     def set_vertices(self, vertices: list[Punto]) -> Self:
-        self.vertices = vertices
+        return self.set_coordenadas([v.get_tuple() for v in vertices])
+
+    def set_coordenadas(self, coordenadas) -> Self:
+        """Reemplaza la geometría original por un arreglo (n, 3) (se copia)."""
+        self._reemplazar(coordenadas)
 
-        return self.actualizar_dimensiones()
+        return self
 
     def add_vertice(self, vertice: Punto) -> Self:
-        self.vertices.append(vertice)
+        # El vértice llega en coordenadas actuales: se fija la transformación pendiente
+        self._hornear()
+        self._reservar(1)
+        v = self._buffer[self._n]
+        v[:] = vertice.get_tuple()
+        self._n += 1
+        self._medido = True
+        if self._caja is not None:
+            np.minimum(self._caja[0], v, out=self._caja[0])
+            np.maximum(self._caja[1], v, out=self._caja[1])
+
+        return self
 
-        return self.actualizar_dimensiones()
+    def add_vertices(self, coordenadas) -> Self:
+        """Agrega un arreglo (k, 3) de vértices (en coordenadas actuales) de una vez."""
+        V = np.asarray(coordenadas, dtype=np.float64).reshape(-1, 3)
+        if len(V) == 0:
+            return self
+        self._hornear()
+        self._reservar(len(V))
+        self._buffer[self._n:self._n + len(V)] = V
+        self._n += len(V)
+        self._medido = True
+        if self._caja is not None:
+            np.minimum(self._caja[0], V.min(axis=0), out=self._caja[0])
+            np.maximum(self._caja[1], V.max(axis=0), out=self._caja[1])
+
+        return self
+
+    # ---------- serialización ----------
 
     def matriz_plana(self) -> list[list[int | float]]:
-        return [v.vector_plano() for v in self.vertices]
+        return self._materializar().tolist()
 
     def matriz_anidada(self) -> list[list[list[int | float]]]:
-        return [v.vector_anidado() for v in self.vertices]
-    
+        return self._materializar()[:, :, None].tolist()
+
     def __str__(self) -> str:
-        return "[" + ", ".join(f"({v.x}, {v.y}, {v.z})" for v in self.vertices) + "]"
+        return "[" + ", ".join(f"({x}, {y}, {z})" for x, y, z in self._materializar().tolist()) + "]"
 
     def __repr__(self) -> str:
         return self.__str__()
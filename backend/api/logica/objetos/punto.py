@@ -1,12 +1,37 @@
+from typing import Self, Sequence
+
+import numpy as np
+
 from logica.libreria.tipos import coordenada
 
 
 class Punto:
+    """
+    Punto 3D compacto (__slots__: sin __dict__ por instancia).
+    El constructor conserva la firma de vector columna [[x], [y], [z]];
+    desde_tupla / desde_array arman puntos sin listas intermedias.
+    """
+
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, m: list[list[int | float]]) -> None:
         self.x = m[0][0]
         self.y = m[1][0]
         self.z = m[2][0]
 
+    @classmethod
+    def desde_tupla(cls, t: Sequence[coordenada]) -> Self:
+        """Punto desde (x, y, z) plano."""
+        p = cls.__new__(cls)
+        p.x, p.y, p.z = t
+        return p
+
+    @classmethod
+    def desde_array(cls, a: np.ndarray) -> list[Self]:
+        """Un Punto por fila de un arreglo (n, 3) (o uno solo para shape (3,))."""
+        filas = np.asarray(a, dtype=np.float64).reshape(-1, 3).tolist()
+        return [cls.desde_tupla(f) for f in filas]
+
     def __str__(self) -> str:
         return f"{self.vector_plano()}"
 
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Sub-instancias (por tupla de salas) que conserva cada MatrizRestricciones
+MAX_SUBS = 128
+
+
+class MatrizRestricciones:
+    """
+    Matriz de adyacencia de todas las salas conocidas, construida una sola vez:
+      - nombres / ids: nombre de sala <-> id entero (orden de rooms.json si se da)
+      - A: densa numpy.int16 simétrica (default_weight, 0 prohibido, prefs)
+      - prohibidos: (k, 2) pares (i, j) con A=0 explícito
+      - preferidos: (k, 3) filas (i, j, peso)
+    """
+
+    def __init__(self,
+                 nombres: List[str],
+                 zero_pairs: Sequence[Sequence[str]],
+                 prefs: Sequence[dict],
+                 default_weight: int = 1) -> None:
+        self.nombres = list(nombres)
+        self.ids: Dict[str, int] = {r: i for i, r in enumerate(self.nombres)}
+        self.default_weight = default_weight
+
+        n = len(self.nombres)
+        self.prohibidos = np.array([[self.ids[a], self.ids[b]] for a, b in zero_pairs],
+                                   dtype=np.intp).reshape(-1, 2)
+        self.preferidos = np.array([[self.ids[p["pair"][0]], self.ids[p["pair"][1]], p["weight"]]
+                                    for p in prefs], dtype=np.intp).reshape(-1, 3)
+
+        A = np.full((n, n), default_weight, dtype=np.int16)
+        np.fill_diagonal(A, 0)  # no nos interesa i~i
+        i, j = self.prohibidos[:, 0], self.prohibidos[:, 1]
+        A[i, j] = A[j, i] = 0
+        i, j, w = self.preferidos[:, 0], self.preferidos[:, 1], self.preferidos[:, 2]
+        A[i, j] = A[j, i] = w
+        A.setflags(write=False)
+        self.A = A
+        # LRU propio de la instancia: se libera junto con ella
+        self._subs: OrderedDict[tuple, SubMatriz] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+    def lista(self) -> List[List[int]]:
+        """A como lista de listas (lo que esperan los solvers puros en Python)."""
+        return self.A.tolist()
+
+    def sub(self, rooms: Sequence[str]) -> SubMatriz:
+        """Sub-instancia para un subconjunto de salas (memoizada por tupla)."""
+        clave = tuple(rooms)
+        sub = self._subs.get(clave)
+        if sub is None:
+            sub = self._subs[clave] = SubMatriz(self, clave)
+            if len(self._subs) > MAX_SUBS:
+                self._subs.popitem(last=False)
+        else:
+            self._subs.move_to_end(clave)
+        return sub
+
+
+class SubMatriz:
+    """
+    Vista liviana de un subconjunto de salas: guarda solo los ids y extrae
+    A[ids][:, ids] de la matriz base la primera vez que se pide.
+    """
+
+    def __init__(self, base: MatrizRestricciones, rooms: Sequence[str]) -> None:
+        self.base = base
+        self.rooms = list(rooms)
+        self.ids = np.array([base.ids[r] for r in self.rooms], dtype=np.intp)
+        self._A: Optional[np.ndarray] = None
+        self._lista: Optional[List[List[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.rooms)
+
+    @property
+    def A(self) -> np.ndarray:
+        if self._A is None:
+            self._A = self.base.A[np.ix_(self.ids, self.ids)]
+            self._A.setflags(write=False)
+        return self._A
+
+    def lista(self) -> List[List[int]]:
+        if self._lista is None:
+            self._lista = self.A.tolist()
+        return self._lista
+
+
+# ruta -> (firma stat, sha256, matriz)
+_cargadas: Dict[tuple, tuple] = {}
+
+
+def _firma(ruta: Optional[str]):
+    if ruta is None:
+        return None
+    st = os.stat(ruta)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _leer(ruta: Optional[str]) -> bytes:
+    if ruta is None:
+        return b""
+    with open(ruta, "rb") as f:
+        return f.read()
+
+
+def cargar_restricciones(ruta: str = "restricciones.json",
+                         ruta_rooms: Optional[str] = None,
+                         default_weight: int = 1) -> MatrizRestricciones:
+    """
+    Carga restricciones.json (y opcionalmente rooms.json para fijar el orden y
+    sumar salas sin restricciones) y devuelve la MatrizRestricciones.
+    Memoizada: si mtime/tamaño no cambiaron se devuelve la misma instancia; si
+    cambiaron pero el contenido (sha256) es el mismo, también.
+    """
+    clave = (os.path.abspath(ruta),
+             os.path.abspath(ruta_rooms) if ruta_rooms else None,
+             default_weight)
+    firma = (_firma(ruta), _firma(ruta_rooms))
+
+    previa = _cargadas.get(clave)
+    if previa is not None and previa[0] == firma:
+        return previa[2]
+
+    crudo, crudo_rooms = _leer(ruta), _leer(ruta_rooms)
+    sha = hashlib.sha256(crudo + b"\0" + crudo_rooms).hexdigest()
+    if previa is not None and previa[1] == sha:
+        _cargadas[clave] = (firma, sha, previa[2])
+        return previa[2]
+
+    data = json.loads(crudo)
+    nombres: List[str] = json.loads(crudo_rooms) if ruta_rooms else []
+    vistos = set(nombres)
+    pares = [tuple(p) for p in data["zero_pairs"]] + [tuple(p["pair"]) for p in data["preferences"]]
+    for par in pares:
+        for r in par:
+            if r not in vistos:
+                vistos.add(r)
+                nombres.append(r)
+
+    matriz = MatrizRestricciones(nombres, data["zero_pairs"], data["preferences"], default_weight)
+    _cargadas[clave] = (firma, sha, matriz)
+    return matriz
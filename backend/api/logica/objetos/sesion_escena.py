@@ -0,0 +1,152 @@
+import math
+from typing import Iterable
+
+import numpy as np
+
+from logica.libreria.binario import empaquetar
+from logica.objetos.escena import Escena
+from logica.objetos.hexagono import geometria_piso
+from logica.objetos.indice_hex import IndiceHex
+from logica.objetos.malla_hex import axiales
+
+EJES = ("x", "y", "z")
+
+
+def _numero(cmd: dict, clave: str, defecto: float) -> float:
+    """cmd[clave] como float finito (ValueError si no es un número)."""
+    valor = cmd.get(clave, defecto)
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)) or not math.isfinite(valor):
+        raise ValueError(f"Invalid {clave}: expected a number")
+    return float(valor)
+
+
+def _vector(cmd: dict, clave: str) -> tuple[float, float, float]:
+    """cmd[clave] como [x, y, z] de números finitos."""
+    valor = cmd.get(clave, (0, 0, 0))
+    if not isinstance(valor, (list, tuple)) or len(valor) != 3:
+        raise ValueError(f"Invalid {clave}: expected [x, y, z]")
+    x, y, z = (_numero({clave: v}, clave, 0) for v in valor)
+    return x, y, z
+
+
+class SesionEscena:
+    """
+    Estado de un cliente del WebSocket de pisos: los hexágonos del piso en una
+    Escena del lado del servidor. Los comandos transforman una selección de
+    objetos en bloque y devuelven qué ids cambiaron; diff() arma el mensaje
+    con solo esos objetos.
+
+    Ids: el índice de cada hexágono en el piso (orden de Piso.centros);
+    'celda' es su coordenada axial [q, r].
+    """
+
+    def __init__(self, radio: float = 1.0, espesor: float = 0.1, anillos: int = 1) -> None:
+        # mismos hexágonos que Piso(radio, espesor, anillos).escena(), armados
+        # directo desde la geometría cacheada (sin un Objeto por celda)
+        _, H = geometria_piso(float(radio), float(espesor), anillos)
+        self.axiales = axiales(anillos)
+        self.indice = IndiceHex(self.axiales, float(radio))
+        self.escena = Escena.desde_bloques(H)
+        self._original = self.escena.vertices.copy()
+        self.seq = 0
+
+    # ---------- selección ----------
+
+    def _seleccion(self, cmd: dict) -> np.ndarray:
+        """Índices pedidos por 'ids', 'cells'/'cell' (axiales) o 'all'."""
+        if cmd.get("all") is True:
+            return np.arange(len(self.escena))
+        if not any(k in cmd for k in ("ids", "cells", "cell")) and not ("x" in cmd and "y" in cmd):
+            raise ValueError("Missing selection: ids, cells, cell or all")
+        try:
+            if "ids" in cmd:
+                ids = np.asarray(cmd["ids"], dtype=np.int64).reshape(-1)
+            elif "cells" in cmd or "cell" in cmd:
+                celdas = np.asarray(cmd.get("cells", [cmd.get("cell")]), dtype=np.int64).reshape(-1, 2)
+                ids = self.indice.buscar(celdas)
+            else:
+                # rotate_object original: (x, y) se toma como la celda axial (q, r)
+                ids = self.indice.buscar(np.array([[cmd["x"], cmd["y"]]], dtype=np.int64))
+        except (ValueError, TypeError, OverflowError) as e:
+            raise ValueError("Invalid selection: expected integer ids or [q, r] cells") from e
+        if len(ids) == 0 or (ids < 0).any() or (ids >= len(self.escena)).any():
+            raise ValueError("No object at position")
+        return np.unique(ids)
+
+    # ---------- comandos ----------
+
+    def aplicar(self, cmd: dict) -> set[int]:
+        """
+        Aplica un comando de transformación; devuelve los ids que cambiaron.
+        Un comando mal formado (tipos o campos inválidos) levanta ValueError
+        sin tocar la escena.
+        """
+        if not isinstance(cmd, dict):
+            raise ValueError("Command must be a JSON object")
+        tipo = cmd.get("type")
+
+        if tipo in ("rotate", "rotate_object"):
+            eje = str(cmd.get("axis", "")).lower()
+            if eje not in EJES:
+                raise ValueError("Invalid axis")
+            veces = cmd.get("times", 1)
+            if isinstance(veces, bool) or not isinstance(veces, int):
+                raise ValueError("Invalid times: expected an integer")
+            angulo = _numero(cmd, "angle", 5) * veces
+            pivote = cmd.get("pivot", "centro")
+            if pivote not in (None, "centro"):
+                raise ValueError("Invalid pivot: expected \"centro\" or null")
+            sel = self._seleccion(cmd)
+            rotar = {"x": self.escena.rotar_x, "y": self.escena.rotar_y, "z": self.escena.rotar_z}[eje]
+            rotar(angulo, sel, pivote)
+            return set(sel.tolist())
+
+        if tipo == "translate":
+            dx, dy, dz = _vector(cmd, "delta")
+            sel = self._seleccion(cmd)
+            self.escena.trasladar(dx, dy, dz, sel)
+            return set(sel.tolist())
+
+        if tipo == "reset":
+            sel = self._seleccion(cmd) if any(k in cmd for k in ("ids", "cells", "cell")) \
+                else np.arange(len(self.escena))
+            off = self.escena.offsets
+            for i in sel.tolist():
+                self.escena.vertices[off[i]:off[i + 1]] = self._original[off[i]:off[i + 1]]
+            return set(sel.tolist())
+
+        raise ValueError("Unknown command type")
+
+    # ---------- mensajes ----------
+
+    def snapshot(self) -> dict:
+        self.seq += 1
+        return {
+            "type": "floor",
+            "seq": self.seq,
+            "objetos": [{"id": i, "celda": qr, "vertices": v}
+                        for i, (qr, v) in enumerate(zip(self.axiales.tolist(),
+                                                        self.escena.matrices_planas()))],
+        }
+
+    def diff(self, ids: Iterable[int], comandos: int = 1) -> dict:
+        """Solo los objetos cambiados; 'comandos' = cuántos se juntaron en este diff."""
+        ids = sorted(ids)
+        self.seq += 1
+        return {
+            "type": "diff",
+            "seq": self.seq,
+            "comandos": comandos,
+            "ids": ids,
+            "vertices": [self.escena.coordenadas(i).tolist() for i in ids],
+        }
+
+    def diff_binario(self, ids: Iterable[int], comandos: int = 1) -> tuple[dict, bytes]:
+        """Cabecera JSON del diff + vértices en el formato de logica.libreria.binario."""
+        ids = sorted(ids)
+        self.seq += 1
+        cabecera = {"type": "diff", "seq": self.seq, "comandos": comandos, "ids": ids,
+                    "binario": True}
+        bloques = np.stack([self.escena.coordenadas(i) for i in ids]) if ids \
+            else np.empty((0, 12, 3))
+        return cabecera, empaquetar(bloques)
@@ -2,6 +2,8 @@ from fastapi import FastAPI
 from routers.rooms import router as rooms_router
 from routers.habitats import router as habitats_router
 from routers.formas import router as formas_router
+from routers.solver import router as solver_router
+from routers.metricas import router as metricas_router
 from fastapi.middleware.cors import CORSMiddleware
 
 
@@ -20,8 +22,11 @@ app.add_middleware(
     allow_credentials=False,         # pon True SOLO si usas cookies/autenticación
     allow_methods=["*"],             # GET, POST, OPTIONS...
     allow_headers=["*"],             # Content-Type, Authorization...
+    expose_headers=["ETag"],         # el front lo reenvía en If-None-Match
 )
 
 app.include_router(rooms_router)
 app.include_router(habitats_router)
 app.include_router(formas_router)
+app.include_router(solver_router)
+app.include_router(metricas_router)
@@ -0,0 +1,52 @@
+import numpy as np
+
+from logica.algoritmo.genetico.backtracking import solve_backtracking
+from logica.algoritmo.genetico.piso_hex import solve_piso_hex
+from logica.algoritmo.genetico.pisos import solve_pisos
+from logica.objetos.hexagono import Piso
+
+
+def instancia(n: int, semilla: int):
+    """Salas r0..r{n-1} y una A simétrica al azar (pesos 1..5, algunos 0)."""
+    rng = np.random.default_rng(semilla)
+    A = rng.integers(1, 6, (n, n))
+    A[rng.random((n, n)) < 0.1] = 0
+    A = np.triu(A, 1)
+    A = A + A.T
+    return [f"r{i}" for i in range(n)], A.tolist()
+
+
+def test_piso_de_una_sala_es_factible():
+    # con capacidades [4, 4, 1] el último piso tiene que quedar con una sala
+    rooms, A = instancia(9, 1)
+    for workers in (1, None):
+        pisos, score, _ = solve_pisos(rooms, A, [4, 4, 1], workers=workers)
+        assert score != -10**9
+        assert [len(p["rooms"]) for p in pisos] == [4, 4, 1]
+        assert pisos[2]["layout"] == pisos[2]["rooms"] and pisos[2]["score"] == 0
+        assert score == sum(p["score"] for p in pisos)
+        assert sorted(r for p in pisos for r in p["rooms"]) == sorted(rooms)
+
+
+def test_piso_de_dos_salas_igual_que_el_solver():
+    rooms, A = instancia(9, 2)
+    pisos, score, _ = solve_pisos(rooms, A, [7, 2], workers=1)
+    chico = pisos[1]
+    idx = [rooms.index(r) for r in chico["rooms"]]
+    sub = [[A[i][j] for j in idx] for i in idx]
+    perm, esperado, _ = solve_backtracking(chico["rooms"], sub, anchor_room=chico["rooms"][0])
+    if perm is None:
+        assert chico["layout"] is None and score == -10**9
+    else:
+        assert chico["layout"] == [chico["rooms"][i] for i in perm]
+        assert chico["score"] == esperado
+
+
+def test_solver_hex_resuelve_tambien_los_pisos_chicos():
+    indice = Piso(1, 0.1).indice()
+    rooms, A = instancia(6, 3)
+    pisos, _, _ = solve_pisos(rooms, A, [3, 2, 1], solver=solve_piso_hex, workers=1,
+                              indice=indice, tiempo_limite=0.1, semilla=0)
+    for p in pisos:
+        assert len(p["layout"]) == len(indice.axiales)
+        assert sorted(r for r in p["layout"] if r is not None) == sorted(p["rooms"])
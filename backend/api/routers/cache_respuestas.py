@@ -0,0 +1,122 @@
+# routers/cache_respuestas.py
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from fastapi import Request, Response
+
+from logica.libreria.binario import MEDIA_BINARIO
+
+
+def acepta_binario(request: Request) -> bool:
+    """El cliente pidió el formato binario de mallas en Accept."""
+    return MEDIA_BINARIO in request.headers.get("accept", "")
+
+
+def codificar_json(datos: Any) -> bytes:
+    return json.dumps(datos, separators=(",", ":"), allow_nan=False).encode()
+
+
+class CacheRespuestas:
+    """
+    Cache de respuestas de geometría ya codificadas:
+      - guarda los bytes JSON o binarios (y su ETag) por clave de parámetros
+        y formato (negociado por Accept)
+      - LRU acotado por bytes totales ('max_bytes') y por 'max_entradas'
+      - si el cliente manda If-None-Match con el ETag vigente responde 304
+        sin cuerpo
+    Contadores: hits, misses, not_modified, evictions, bytes servidos.
+    """
+
+    def __init__(self, nombre: str, max_bytes: int = 64 << 20, max_entradas: int = 1024) -> None:
+        self.nombre = nombre
+        self.max_bytes = max_bytes
+        self.max_entradas = max_entradas
+        self._entradas: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+        self.bytes_servidos = 0
+
+    def _obtener(self, clave: Hashable, codificar: Callable[[], bytes]) -> tuple[bytes, str]:
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                self._entradas.move_to_end(clave)
+                self.hits += 1
+                return entrada
+
+        # se codifica fuera del lock; dos misses simultáneos calculan lo mismo
+        cuerpo = codificar()
+        etag = '"' + hashlib.sha256(cuerpo).hexdigest()[:32] + '"'
+        entrada = (cuerpo, etag)
+
+        with self._lock:
+            self.misses += 1
+            if len(cuerpo) <= self.max_bytes:
+                if clave not in self._entradas:
+                    self._bytes += len(cuerpo)
+                    self._entradas[clave] = entrada
+                while self._bytes > self.max_bytes or len(self._entradas) > self.max_entradas:
+                    _, (viejo, _) = self._entradas.popitem(last=False)
+                    self._bytes -= len(viejo)
+                    self.evictions += 1
+        return entrada
+
+    def responder(self,
+                  request: Request,
+                  clave: Hashable,
+                  generar: Callable[[], Any],
+                  binario: Optional[Callable[[], bytes]] = None) -> Response:
+        """
+        Respuesta de generar() como JSON, o de binario() si se da y el cliente
+        acepta MEDIA_BINARIO (cacheadas por 'clave' y formato); 304 si el ETag
+        coincide con If-None-Match.
+        """
+        if binario is not None and acepta_binario(request):
+            media_type = MEDIA_BINARIO
+            cuerpo, etag = self._obtener((clave, media_type), binario)
+        else:
+            media_type = "application/json"
+            cuerpo, etag = self._obtener((clave, media_type), lambda: codificar_json(generar()))
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+
+        pedidos = request.headers.get("if-none-match", "")
+        if etag in [e.strip() for e in pedidos.split(",")] or pedidos.strip() == "*":
+            with self._lock:
+                self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+
+        with self._lock:
+            self.bytes_servidos += len(cuerpo)
+        return Response(content=cuerpo, media_type=media_type, headers=headers)
+
+    def contadores(self) -> dict:
+        consultas = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / consultas if consultas else 0.0,
+            "not_modified": self.not_modified,
+            "evictions": self.evictions,
+            "entradas": len(self._entradas),
+            "bytes": self._bytes,
+            "bytes_servidos": self.bytes_servidos,
+        }
+
+    def limpiar(self) -> None:
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+
+
+# Una por endpoint de geometría (se listan en /metricas)
+cache_pisos = CacheRespuestas("formas/piso")
+cache_rooms = CacheRespuestas("rooms")
+CACHES = [cache_pisos, cache_rooms]
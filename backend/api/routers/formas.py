@@ -1,81 +1,132 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import asyncio
+import json
+
+from fastapi import APIRouter, Query, Request, Response, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
-from logica.objetos.hexagono import hexagono, Piso as P
+from logica.objetos.hexagono import geometria_piso, hexagono
 from logica.objetos.punto import Punto
+from logica.objetos.sesion_escena import SesionEscena
+from logica.libreria.binario import MEDIA_BINARIO, empaquetar
+from routers.cache_respuestas import acepta_binario, cache_pisos
 
 router = APIRouter(prefix="/formas")
 
+# Comandos de /ws/piso leídos y todavía sin aplicar: con la cola llena el
+# lector deja de leer el socket hasta que el bucle principal avance
+MAX_PENDIENTES = 256
+
 class HexPayload(BaseModel):
     centro: list[list[float]]
     radio: float
 
 
 @router.post("/hex")
-def hex(payload: HexPayload):
+def hex(payload: HexPayload, request: Request):
     centro = Punto(payload.centro)
-    return hexagono(centro, payload.radio).matriz_plana()
+    o = hexagono(centro, payload.radio)
+    if acepta_binario(request):
+        return Response(content=empaquetar(o.coordenadas[None]), media_type=MEDIA_BINARIO)
+    return o.matriz_plana()
 
 
 @router.get("/piso")
-def piso_get(radio: float, espesor: float):
-    floor_matrix = P(radio, espesor).centros
+def piso_get(request: Request, radio: float, espesor: float,
+             anillos: int = Query(default=1, ge=0, le=64)):
+    def generar():
+        # centros precalculados por (radio, espesor, anillos), sin un Punto por celda
+        centros, _ = geometria_piso(radio, espesor, anillos)
+        return [{"x": x, "y": y, "z": z} for x, y, z in centros.tolist()]
 
-    return floor_matrix
+    def generar_binario():
+        centros, _ = geometria_piso(radio, espesor, anillos)
+        return empaquetar(centros[:, None, :])
 
-# ------------------ WS ------------------
-class RotateCommand(BaseModel):
-    x: int
-    y: int
-    z: int
-    axis: str
-    times: int = 1
+    return cache_pisos.responder(request, (radio, espesor, anillos), generar, generar_binario)
 
+# ------------------ WS ------------------
 @router.websocket("/ws/piso")
-async def piso_ws(websocket: WebSocket):
+async def piso_ws(websocket: WebSocket, radio: float = 1.0, espesor: float = 0.1,
+                  anillos: int = Query(default=1, ge=0, le=64), binario: bool = False):
+    """
+    Escena por conexión, del lado del servidor:
+      {"type": "get_floor"}                                -> {"type": "floor", ...} completo
+      {"type": "rotate", "axis": "z", "angle": 5, "ids": [..] | "cells": [[q, r]] | "all": true}
+      {"type": "translate", "delta": [dx, dy, dz], ...}    {"type": "reset", ...}
+      ("rotate_object" con x, y, axis, times sigue andando: (x, y) = celda axial)
+    Cada lote de comandos responde un solo {"type": "diff"} con los objetos que
+    cambiaron. Si el cliente manda más rápido de lo que se envía, los comandos
+    que se acumularon mientras tanto se aplican juntos en el siguiente diff.
+    Con ?binario=true los vértices del diff van en un frame binario aparte
+    (formato de logica.libreria.binario).
+    """
     await websocket.accept()
 
-    floor_matrix = P(radio=1.0, espesor=0.1).centros
-
+    sesion = SesionEscena(radio, espesor, anillos)
+    cola: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDIENTES)
+    fin = object()  # marca de cierre en la cola (un mensaje JSON null es un comando más)
+
+    async def leer():
+        # Lee frames hasta que el cliente se va. Un frame que no es JSON (o es
+        # binario) se encola como error y se sigue leyendo; ante cualquier otra
+        # falla del socket se encola 'fin' para que el bucle principal termine.
+        # Si se cancela la tarea es porque el bucle principal ya terminó.
+        try:
+            while True:
+                mensaje = await websocket.receive()
+                if mensaje["type"] == "websocket.disconnect":
+                    break
+                texto = mensaje.get("text")
+                if texto is None:
+                    await cola.put(ValueError("Expected a JSON text frame"))
+                    continue
+                try:
+                    await cola.put(json.loads(texto))
+                except ValueError:
+                    await cola.put(ValueError("Invalid JSON"))
+        except Exception:
+            pass
+        await cola.put(fin)
+
+    lector = asyncio.create_task(leer())
     try:
         while True:
-            data = await websocket.receive_json()
-            command_type = data.get("type")
-
-            if command_type == "get_floor":
-                # Devolver la matriz completa al cliente
-                await websocket.send_json({"type": "floor", "matrix": floor_matrix})
-
-            elif command_type == "rotate_object":
-                x = data["x"]
-                y = data["y"]
-                z = data["z"]
-                axis = data["axis"]
-                times = data.get("times", 1)
-
+            lote = [await cola.get()]
+            while not cola.empty() and lote[-1] is not fin:
+                lote.append(cola.get_nowait())
+
+            cambiados: set[int] = set()
+            aplicados = 0
+            pedir_piso = False
+            for data in lote:
+                if data is fin:
+                    break
+                if isinstance(data, ValueError):
+                    await websocket.send_json({"type": "error", "error": str(data)})
+                    continue
+                if isinstance(data, dict) and data.get("type") == "get_floor":
+                    pedir_piso = True
+                    continue
                 try:
-                    obj = floor_matrix[x][y][z].get("o")
-                    if obj is None:
-                        await websocket.send_json({"error": "No object at position"})
-                        continue
-
-                    for _ in range(times):
-                        if axis.lower() == "x":
-                            obj.rotar_x()
-                        elif axis.lower() == "y":
-                            obj.rotar_y()
-                        elif axis.lower() == "z":
-                            obj.rotar_z()
-                        else:
-                            await websocket.send_json({"error": "Invalid axis"})
-                            continue
-
-                    await websocket.send_json({"status": "rotated", "position": [x, y, z], "axis": axis})
-
-                except IndexError:
-                    await websocket.send_json({"error": "Position out of bounds"})
-
-            else:
-                await websocket.send_json({"error": "Unknown command type"})
+                    cambiados |= sesion.aplicar(data)
+                    aplicados += 1
+                except (ValueError, TypeError, KeyError) as e:
+                    await websocket.send_json({"type": "error", "error": str(e), "comando": data})
+
+            if pedir_piso:
+                await websocket.send_json(sesion.snapshot())
+            elif cambiados:
+                if binario:
+                    cabecera, cuerpo = sesion.diff_binario(cambiados, aplicados)
+                    await websocket.send_json(cabecera)
+                    await websocket.send_bytes(cuerpo)
+                else:
+                    await websocket.send_json(sesion.diff(cambiados, aplicados))
+
+            if lote[-1] is fin:
+                break
 
     except WebSocketDisconnect:
-        print("Client disconnected")
\ No newline at end of file
+        pass
+    finally:
+        lector.cancel()
+        print("Client disconnected")
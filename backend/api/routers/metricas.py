@@ -0,0 +1,32 @@
+# routers/metricas.py
+from fastapi import APIRouter
+
+from logica.algoritmo.genetico.cache import cache_soluciones
+from logica.objetos.hexagono import geometria_piso, plantilla_hexagono
+from routers.cache_respuestas import CACHES
+
+router = APIRouter(prefix="/metricas", tags=["Metricas"])
+
+
+def _lru(f) -> dict:
+    info = f.cache_info()
+    consultas = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_ratio": info.hits / consultas if consultas else 0.0,
+        "entradas": info.currsize,
+        "maxsize": info.maxsize,
+    }
+
+
+@router.get("/")
+def metricas():
+    return {
+        "respuestas": {c.nombre: c.contadores() for c in CACHES},
+        "geometria": {
+            "geometria_piso": _lru(geometria_piso),
+            "plantilla_hexagono": _lru(plantilla_hexagono),
+        },
+        "solver": cache_soluciones.contadores(),
+    }
@@ -1,10 +1,12 @@
 # routers/rooms.py
 from enum import Enum
 from typing import Optional, List
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from pydantic import BaseModel, Field, conlist
 
-from logica.objetos.hexagono import Piso
+from logica.libreria.binario import empaquetar
+from logica.objetos.hexagono import Piso, geometria_piso
+from routers.cache_respuestas import cache_rooms
 
 PREFIX = "/rooms"
 router = APIRouter(prefix=PREFIX, tags=["Rooms"])
@@ -40,11 +42,14 @@ class Formulario(BaseModel):
     notas: str
 
 @router.post("/")
-def obtener_piso(payload: Formulario):
+def obtener_piso(payload: Formulario, request: Request):
     # TODO: usa payload para parametrizar (radio/espesor) si quieres
-    matriz = Piso(1, 0.25).hexagonos()
-    # Asegúrate de que 'matriz' sea JSON-serializable (listas/nums)
-    return matriz
+    radio, espesor = 1, 0.25
+    # La clave son los parámetros de la geometría; JSON ya codificado + ETag
+    # (Accept: application/vnd.habitat.mesh -> vértices float32 + índices por hexágono)
+    return cache_rooms.responder(request, (radio, espesor),
+                                 lambda: Piso(radio, espesor).hexagonos(),
+                                 lambda: empaquetar(geometria_piso(radio, espesor)[1]))
 
 @router.get("/{id}")
 def obtener_room_data(id: str):
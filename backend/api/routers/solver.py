@@ -0,0 +1,368 @@
+# routers/solver.py
+import asyncio
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from enum import Enum
+from typing import Any, Dict, List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+
+from logica.algoritmo.genetico.algoritmo_genetico import solve_genetico
+from logica.algoritmo.genetico.backtracking import solve_backtracking
+from logica.algoritmo.genetico.busqueda_local import solve_local_search
+from logica.algoritmo.genetico.cache import cache_soluciones, huella_instancia
+from logica.algoritmo.genetico.control import Cancelacion
+from logica.algoritmo.genetico.held_karp import solve_held_karp
+from logica.objetos.restricciones import cargar_restricciones
+
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUTA_RESTRICCIONES = os.path.join(BASE, "restricciones.json")
+RUTA_ROOMS = os.path.join(BASE, "rooms.json")
+
+# Trabajos terminados que se conservan para consulta
+MAX_TRABAJOS = 256
+# Tope del presupuesto de tiempo que puede pedir un cliente (s)
+TIEMPO_MAX = 300.0
+
+# =========================
+# Modelos
+# =========================
+
+class Engine(str, Enum):
+    backtracking = "backtracking"
+    held_karp = "held_karp"
+    genetico = "genetico"
+    busqueda_local = "busqueda_local"
+
+class SolveRequest(BaseModel):
+    rooms: Optional[List[str]] = None          # None = todas las de rooms.json
+    anchor: Optional[str] = None
+    engine: Engine = Engine.backtracking
+    tiempo_limite: float = Field(default=10.0, gt=0, le=TIEMPO_MAX)
+    max_nodos: Optional[int] = Field(default=None, gt=0)
+    opciones: Dict[str, Any] = Field(default_factory=dict)  # ver OPCIONES[engine]
+
+# Opciones que un cliente puede pasarle a cada solver. Lo interno (verbose,
+# engine, memoria_max, chunk_bytes, perm_inicial, ...) no se expone y los
+# tamaños quedan acotados.
+
+class _Opciones(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+class OpcionesBacktracking(_Opciones):
+    bound: bool = False
+    simetria: bool = False
+
+class OpcionesHeldKarp(_Opciones):
+    pass
+
+class OpcionesGenetico(_Opciones):
+    poblacion: int = Field(default=200, ge=4, le=5000)
+    elite: int = Field(default=4, ge=0, le=100)
+    torneo: int = Field(default=3, ge=1, le=32)
+    cruce: Literal["ox", "pmx"] = "ox"
+    prob_swap: float = Field(default=0.2, ge=0, le=1)
+    prob_inversion: float = Field(default=0.2, ge=0, le=1)
+    semilla: Optional[int] = None
+
+    @model_validator(mode="after")
+    def _tamaños(self):
+        if self.elite >= self.poblacion or self.torneo > self.poblacion:
+            raise ValueError("elite and torneo must be smaller than poblacion")
+        return self
+
+class OpcionesBusquedaLocal(_Opciones):
+    reinicios: Optional[int] = Field(default=None, ge=0, le=100_000)
+    or_max: int = Field(default=3, ge=1, le=8)
+    muestras: int = Field(default=64, ge=1, le=1024)
+    semilla: Optional[int] = None
+
+OPCIONES = {
+    Engine.backtracking: OpcionesBacktracking,
+    Engine.held_karp: OpcionesHeldKarp,
+    Engine.genetico: OpcionesGenetico,
+    Engine.busqueda_local: OpcionesBusquedaLocal,
+}
+
+SOLVERS = {
+    Engine.backtracking: solve_backtracking,
+    Engine.held_karp: solve_held_karp,
+    Engine.genetico: solve_genetico,
+    Engine.busqueda_local: solve_local_search,
+}
+
+# =========================
+# Ejecución (en el process pool)
+# =========================
+
+def _kwargs_control(engine: Engine, req: SolveRequest) -> dict:
+    """Presupuestos que entiende cada engine (held_karp corre hasta el final)."""
+    if engine == Engine.backtracking:
+        return {"tiempo_limite": req.tiempo_limite, "max_nodos": req.max_nodos}
+    if engine == Engine.genetico:
+        return {"tiempo_limite": req.tiempo_limite, "generaciones": None}
+    if engine == Engine.busqueda_local:
+        return {"tiempo_limite": req.tiempo_limite}
+    return {}
+
+def _ejecutar(job_id: str, engine: Engine, rooms: List[str], A, anchor: Optional[str],
+              kwargs: dict, cola, evento):
+    """Corre el solver en un worker y publica el progreso en la cola compartida."""
+    if engine != Engine.held_karp:
+        def progreso(info: dict):
+            perm = info["best_perm"]
+            info["best_perm"] = None if perm is None else [rooms[i] for i in perm]
+            cola.put((job_id, info))
+
+        kwargs = dict(kwargs, cancelacion=Cancelacion(evento), progreso=progreso)
+
+    inicio = time.perf_counter()
+    perm, score, stats = SOLVERS[engine](rooms, A, anchor, **kwargs)
+    return perm, score, stats, time.perf_counter() - inicio
+
+# =========================
+# Registro de trabajos
+# =========================
+
+class Trabajo:
+    def __init__(self, job_id: str, engine: Engine, rooms: List[str], evento) -> None:
+        self.id = job_id
+        self.engine = engine
+        self.rooms = rooms
+        self.evento = evento
+        self.estado = "pendiente"
+        self.progreso: Optional[dict] = None
+        self.resultado: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.suscriptores: set[asyncio.Queue] = set()
+
+    def snapshot(self) -> dict:
+        return {
+            "job_id": self.id,
+            "engine": self.engine.value,
+            "estado": self.estado,
+            "progreso": self.progreso,
+            "resultado": self.resultado,
+            "error": self.error,
+        }
+
+    def publicar(self, mensaje: dict) -> None:
+        for q in self.suscriptores:
+            q.put_nowait(mensaje)
+
+
+_trabajos: "OrderedDict[str, Trabajo]" = OrderedDict()
+_pool: Optional[ProcessPoolExecutor] = None
+_manager = None
+_cola = None
+_bombeo: Optional[asyncio.Task] = None
+# tareas _correr en curso (el loop solo guarda referencias débiles a las tareas)
+_tareas: set[asyncio.Task] = set()
+
+
+@asynccontextmanager
+async def ciclo_de_vida(app):
+    """
+    Pool, Manager y cola de progreso viven lo mismo que la app: se crean al
+    arrancar y se apagan al salir (los trabajos en curso se cancelan). Los
+    workers usan 'spawn' para no heredar hilos ni el event loop de uvicorn.
+    Crear el Manager arranca un proceso: se hace fuera del event loop.
+    """
+    global _pool, _manager, _cola, _bombeo
+    contexto = mp.get_context("spawn")
+    _pool = ProcessPoolExecutor(mp_context=contexto)
+    _manager = await asyncio.to_thread(contexto.Manager)
+    _cola = await asyncio.to_thread(_manager.Queue)
+    _bombeo = asyncio.get_running_loop().create_task(_bombear_progreso())
+    try:
+        yield
+    finally:
+        _bombeo.cancel()
+        corriendo = [t.evento for t in _trabajos.values() if t.estado in ("pendiente", "corriendo")]
+        await asyncio.to_thread(lambda: [evento.set() for evento in corriendo])
+        for tarea in list(_tareas):
+            tarea.cancel()
+        await asyncio.gather(*_tareas, return_exceptions=True)
+
+        def apagar():
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _manager.shutdown()
+
+        await asyncio.to_thread(apagar)
+        _pool = _manager = _cola = _bombeo = None
+
+
+router = APIRouter(prefix="/solver", tags=["Solver"], lifespan=ciclo_de_vida)
+
+
+def _recursos():
+    if _pool is None:
+        raise HTTPException(status_code=503, detail="Solver pool is not running")
+    return _pool, _manager, _cola
+
+
+async def _bombear_progreso():
+    """Reparte los mensajes de progreso de todos los workers a sus trabajos."""
+    while True:
+        try:
+            job_id, info = await asyncio.to_thread(_cola.get, True, 0.5)
+        except queue.Empty:
+            continue
+        trabajo = _trabajos.get(job_id)
+        if trabajo is None or trabajo.estado != "corriendo":
+            continue
+        trabajo.progreso = info
+        trabajo.publicar({"type": "progreso", "job_id": job_id, **info})
+
+
+def _registrar(trabajo: Trabajo) -> None:
+    _trabajos[trabajo.id] = trabajo
+    terminados = [k for k, t in _trabajos.items() if t.estado not in ("pendiente", "corriendo")]
+    for k in terminados[:max(0, len(_trabajos) - MAX_TRABAJOS)]:
+        del _trabajos[k]
+
+
+def _terminar(trabajo: Trabajo, perm, score, stats, cancelado: bool = False) -> None:
+    trabajo.estado = "cancelado" if cancelado else "terminado"
+    trabajo.resultado = {
+        "layout": None if perm is None else [trabajo.rooms[i] for i in perm],
+        "score": score,
+        "stats": asdict(stats),
+    }
+    trabajo.publicar({"type": "resultado", **trabajo.snapshot()})
+
+
+async def _correr(trabajo: Trabajo, A, anchor, kwargs: dict, clave: str) -> None:
+    pool, _, cola = _recursos()
+    trabajo.estado = "corriendo"
+    loop = asyncio.get_running_loop()
+    try:
+        perm, score, stats, segundos = await loop.run_in_executor(
+            pool, _ejecutar, trabajo.id, trabajo.engine, trabajo.rooms, A, anchor,
+            kwargs, cola, trabajo.evento)
+    except Exception as e:
+        trabajo.estado = "error"
+        trabajo.error = repr(e)
+        trabajo.publicar({"type": "error", **trabajo.snapshot()})
+        return
+    cache_soluciones.guardar(clave, trabajo.rooms, perm, score, stats, segundos)
+    # Cancelado solo si el solver cortó por el evento (un DELETE que llega
+    # cuando ya terminó no cambia el resultado). Consultar el evento del
+    # Manager es un viaje IPC: fuera del event loop.
+    cancelado = stats.timed_out and await asyncio.to_thread(trabajo.evento.is_set)
+    _terminar(trabajo, perm, score, stats, cancelado)
+
+# =========================
+# Rutas
+# =========================
+
+@router.post("/jobs", status_code=202)
+async def crear_trabajo(payload: SolveRequest):
+    # lectura, sha256 y parseo del JSON: fuera del event loop
+    restricciones = await asyncio.to_thread(cargar_restricciones, RUTA_RESTRICCIONES, RUTA_ROOMS)
+    rooms = payload.rooms or restricciones.nombres
+    desconocidas = [r for r in rooms if r not in restricciones.ids]
+    if desconocidas:
+        raise HTTPException(status_code=422, detail={"error": "Unknown rooms", "unknown": desconocidas})
+    if payload.anchor is not None and payload.anchor not in rooms:
+        raise HTTPException(status_code=422, detail={"error": "Anchor not in rooms", "anchor": payload.anchor})
+
+    try:
+        opciones = OPCIONES[payload.engine].model_validate(payload.opciones)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail={"error": "Invalid opciones",
+                                                     "engine": payload.engine.value,
+                                                     "errores": e.errors(include_url=False,
+                                                                         include_context=False)})
+
+    A = restricciones.sub(rooms).lista()
+    solver = SOLVERS[payload.engine]
+    kwargs = dict(opciones.model_dump(exclude_unset=True), **_kwargs_control(payload.engine, payload))
+    clave = huella_instancia(solver, rooms, A, payload.anchor, kwargs)
+
+    job_id = uuid.uuid4().hex
+    cacheado = cache_soluciones.buscar(clave, rooms)
+    if cacheado is not None:
+        trabajo = Trabajo(job_id, payload.engine, rooms, threading.Event())
+        _registrar(trabajo)
+        _terminar(trabajo, *cacheado)
+        return {"job_id": job_id, "estado": trabajo.estado, "cache": True}
+
+    _, manager, _ = _recursos()
+    trabajo = Trabajo(job_id, payload.engine, rooms, await asyncio.to_thread(manager.Event))
+    _registrar(trabajo)
+    tarea = asyncio.get_running_loop().create_task(_correr(trabajo, A, payload.anchor, kwargs, clave))
+    _tareas.add(tarea)
+    tarea.add_done_callback(_tareas.discard)
+    return {"job_id": job_id, "estado": trabajo.estado, "cache": False}
+
+
+@router.get("/jobs/{job_id}")
+def obtener_trabajo(job_id: str):
+    trabajo = _trabajos.get(job_id)
+    if trabajo is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return trabajo.snapshot()
+
+
+@router.delete("/jobs/{job_id}")
+def cancelar_trabajo(job_id: str):
+    trabajo = _trabajos.get(job_id)
+    if trabajo is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if trabajo.engine == Engine.held_karp and trabajo.estado in ("pendiente", "corriendo"):
+        # la DP de held_karp no consulta cancelación: corre hasta el final
+        raise HTTPException(status_code=409, detail={"error": "Job not cancellable",
+                                                     "engine": trabajo.engine.value})
+    trabajo.evento.set()
+    return {"job_id": job_id, "estado": trabajo.estado}
+
+
+@router.websocket("/ws/{job_id}")
+async def trabajo_ws(websocket: WebSocket, job_id: str):
+    await websocket.accept()
+    trabajo = _trabajos.get(job_id)
+    if trabajo is None:
+        await websocket.send_json({"error": "Job not found"})
+        await websocket.close()
+        return
+
+    cola: asyncio.Queue = asyncio.Queue()
+    trabajo.suscriptores.add(cola)
+    # se lee el socket en paralelo para enterarse enseguida si el cliente se va
+    # (aunque el trabajo no esté mandando progreso)
+    recibir = asyncio.create_task(websocket.receive())
+    try:
+        await websocket.send_json({"type": "estado", **trabajo.snapshot()})
+        while trabajo.estado in ("pendiente", "corriendo"):
+            siguiente = asyncio.create_task(cola.get())
+            hechos, _ = await asyncio.wait({siguiente, recibir}, return_when=asyncio.FIRST_COMPLETED)
+            if recibir in hechos:
+                if recibir.result()["type"] == "websocket.disconnect":
+                    siguiente.cancel()
+                    return
+                # los mensajes del cliente se ignoran
+                recibir = asyncio.create_task(websocket.receive())
+            if siguiente in hechos:
+                await websocket.send_json(siguiente.result())
+            else:
+                siguiente.cancel()
+        # mensajes que quedaron en cola (incluye el resultado final)
+        while not cola.empty():
+            await websocket.send_json(cola.get_nowait())
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        recibir.cancel()
+        trabajo.suscriptores.discard(cola)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from logica.algoritmo.genetico.backtracking import solve_backtracking
+from logica.algoritmo.genetico.evaluacion import evaluate_perm
+from logica.algoritmo.genetico.paralelo import solve_backtracking_paralelo
+
+
+def instancias(cantidad: int, semilla: int = 0):
+    """A simétricas al azar de 4 a 8 salas (pesos 0..5, 0 = prohibido)."""
+    rng = np.random.default_rng(semilla)
+    for _ in range(cantidad):
+        n = int(rng.integers(4, 9))
+        A = np.triu(rng.integers(0, 6, (n, n)), 1)
+        yield [f"r{i}" for i in range(n)], (A + A.T).tolist()
+
+
+@pytest.mark.parametrize("engine", ["iterativo", "recursivo"])
+@pytest.mark.parametrize("bound", [False, True])
+def test_simetria_no_cambia_el_optimo(engine, bound):
+    for rooms, A in instancias(150):
+        _, score, base = solve_backtracking(rooms, A, engine=engine, bound=bound)
+        perm, score_sim, sim = solve_backtracking(rooms, A, engine=engine, bound=bound,
+                                                  simetria=True)
+        assert score_sim == score
+        if perm is None:
+            assert score == -10**9
+        else:
+            assert evaluate_perm(perm, A) == score
+        if not bound:
+            # cada anillo factible aparece una sola vez en lugar de dos
+            assert 2 * sim.leaves_feasible == base.leaves_feasible
+
+
+def test_simetria_no_cambia_el_optimo_en_paralelo():
+    for rooms, A in instancias(5, semilla=1):
+        _, score, _ = solve_backtracking(rooms, A, bound=True)
+        _, score_sim, _ = solve_backtracking_paralelo(rooms, A, bound=True, workers=2,
+                                                      simetria=True)
+        assert score_sim == score
+
+
+def test_simetria_exige_a_simetrica():
+    rooms = ["a", "b", "c", "d"]
+    A = [[0, 1, 2, 3], [1, 0, 1, 1], [2, 1, 0, 1], [3, 5, 1, 0]]
+    with pytest.raises(ValueError):
+        solve_backtracking(rooms, A, simetria=True)
+    with pytest.raises(ValueError):
+        solve_backtracking_paralelo(rooms, A, simetria=True)
+    # sin simetria una A no simétrica sigue siendo válida
+    assert solve_backtracking(rooms, A)[0] is not None